@@ -19,7 +19,9 @@ from fastapi.responses import StreamingResponse, JSONResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
+import asyncio
 import sqlite3
+from contextlib import asynccontextmanager
 import json
 import hashlib
 import requests
@@ -33,6 +35,12 @@ import random
 import threading
 from collections import Counter
 
+# orjson renders API payloads several times faster than json.dumps
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
@@ -407,6 +415,7 @@ class ScrapeRequest(BaseModel):
     days: int = 14
     pages: int = 5
     sources: List[str] = ["all"]
+    refresh_cache: bool = False
 
 class CompanyResponse(BaseModel):
     id: str
@@ -583,6 +592,11 @@ class JobScraper:
         'notion', 'linear', 'asana', 'monday', 'trello', 'miro', 'lucidchart'
     ]
     
+    # Escaped and compiled once; the lookahead keeps nested skills ('analytics' in 'google analytics')
+    SKILL_RE = re.compile(
+        r'\b(?=(' + '|'.join(re.escape(s) for s in sorted(PM_SKILLS, key=len, reverse=True)) + r')\b)'
+    )
+    
     def __init__(self):
         self.session = requests.Session()
         self.session.headers.update({
@@ -714,13 +728,8 @@ class JobScraper:
     def extract_skills(self, text):
         if not text:
             return []
-        text = text.lower()
-        found_skills = []
-        for skill in self.PM_SKILLS:
-            # Use word boundary matching for more accurate detection
-            if re.search(r'\b' + re.escape(skill) + r'\b', text):
-                found_skills.append(skill)
-        return list(set(found_skills))[:15]
+        # Single word-boundary scan; dict.fromkeys dedupes in first-seen order
+        return list(dict.fromkeys(self.SKILL_RE.findall(text.lower())))[:15]
     
     def is_pm_job(self, title):
         title_lower = title.lower()
@@ -1007,24 +1016,37 @@ class JobScraper:
 # FASTAPI APP
 # ============================================================================
 
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when it's installed"""
+    
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Schema setup is blocking sqlite work; keep it off the event loop
+    await asyncio.to_thread(init_db)
+    yield
+
 app = FastAPI(
     title="PM Job Scraper Pro API",
     version="3.0.0",
-    description="The Ultimate Product Manager Job Hunting Tool"
+    description="The Ultimate Product Manager Job Hunting Tool",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
-    allow_credentials=True,
+    # No cookies/auth headers are used, so skip credentials: a bare "*" lets Starlette
+    # send one precomputed header instead of echoing each request's Origin
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-@app.on_event("startup")
-async def startup():
-    init_db()
-
 scraper_status = {
     "is_running": False,
     "status": "idle",
@@ -1042,6 +1064,9 @@ status_lock = threading.Lock()
 # API ROUTES
 # ============================================================================
 
+# Routes that touch SQLite are plain `def`: FastAPI runs them in its threadpool,
+# so blocking queries never stall the event loop. Only non-blocking routes are async.
+
 @app.get("/")
 async def root():
     return {
@@ -1107,7 +1132,7 @@ def row_to_job_response(row) -> JobResponse:
     )
 
 @app.get("/api/jobs", response_model=JobListResponse)
-async def get_jobs(
+def get_jobs(
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
     search: Optional[str] = None,
@@ -1205,7 +1230,7 @@ async def get_jobs(
     )
 
 @app.get("/api/jobs/{job_id}")
-async def get_job(job_id: str):
+def get_job(job_id: str):
     conn = get_db()
     cursor = conn.cursor()
     cursor.execute("SELECT * FROM jobs WHERE id = ?", (job_id,))
@@ -1218,7 +1243,7 @@ async def get_job(job_id: str):
     return row_to_job_response(row)
 
 @app.patch("/api/jobs/{job_id}")
-async def update_job(job_id: str, update: UpdateJobRequest):
+def update_job(job_id: str, update: UpdateJobRequest):
     conn = get_db()
     cursor = conn.cursor()
     
@@ -1277,7 +1302,7 @@ async def update_job(job_id: str, update: UpdateJobRequest):
     return {"success": True}
 
 @app.post("/api/jobs/{job_id}/status")
-async def change_job_status(job_id: str, status: str = Query(...)):
+def change_job_status(job_id: str, status: str = Query(...)):
     """Quick status change endpoint"""
     conn = get_db()
     cursor = conn.cursor()
@@ -1308,7 +1333,7 @@ async def change_job_status(job_id: str, status: str = Query(...)):
     return {"success": True, "new_status": status}
 
 @app.get("/api/pipeline", response_model=PipelineResponse)
-async def get_pipeline():
+def get_pipeline():
     """Get jobs organized by pipeline stage for Kanban view"""
     conn = get_db()
     cursor = conn.cursor()
@@ -1345,7 +1370,7 @@ async def get_pipeline():
     return PipelineResponse(**pipeline)
 
 @app.get("/api/stats", response_model=StatsResponse)
-async def get_stats():
+def get_stats():
     conn = get_db()
     cursor = conn.cursor()
     
@@ -1499,7 +1524,7 @@ async def get_stats():
     )
 
 @app.get("/api/insights")
-async def get_insights():
+def get_insights():
     """Get AI-powered insights about the job market"""
     conn = get_db()
     cursor = conn.cursor()
@@ -1580,7 +1605,7 @@ async def get_insights():
     }
 
 @app.get("/api/company/{company_name}")
-async def get_company_info(company_name: str):
+def get_company_info(company_name: str):
     """Get detailed company information"""
     company_info = get_company_intelligence(company_name)
     
@@ -1608,13 +1633,13 @@ async def get_company_info(company_name: str):
     }
 
 # Scraper endpoints
-def run_scraper_task(locations, days, pages, sources):
+def run_scraper_task(locations, days, pages, sources, refresh_cache=False):
     global scraper_status
     
     try:
         # Import the new Ultimate scraper
         from backend.scraper import UltimateJobScraper
-        scraper = UltimateJobScraper()
+        scraper = UltimateJobScraper(refresh_cache=refresh_cache)
         
         with status_lock:
             scraper_status["current_source"] = "Starting..."
@@ -1624,51 +1649,41 @@ def run_scraper_task(locations, days, pages, sources):
         raw_jobs = scraper.scrape_all(locations, pages, sources)
         
         with status_lock:
-            scraper_status["total_found"] = len(raw_jobs)
+            # scrape_all returns rows already deduped per unit; report what the boards listed
+            scraper_status["total_found"] = scraper.last_raw_count
             scraper_status["current_source"] = "Processing..."
             scraper_status["progress"] = 50
         
         processed_jobs = scraper.process_jobs(raw_jobs)
         
-        conn = get_db()
-        cursor = conn.cursor()
-        
-        new_count = 0
-        dup_count = 0
+        now = datetime.now().isoformat()
+        rows = [(
+            job['id'], job['title'], job['company'], job['location'],
+            job.get('work_type', ''), job.get('level', ''),
+            job.get('experience', ''), job.get('experience_min', 0), job.get('experience_max', 0),
+            job.get('salary', ''), job.get('salary_min', 0), job.get('salary_max', 0),
+            job.get('salary', ''), job.get('description', ''),
+            json.dumps(job.get('skills', [])), job.get('source', ''), job.get('url', ''),
+            job.get('posted_date', ''), job.get('status', 'new'),
+            1 if job.get('is_bookmarked') else 0, 50,
+            job.get('created_at', now), now
+        ) for job in processed_jobs]
         
-        for job in processed_jobs:
-            cursor.execute("SELECT id FROM jobs WHERE id = ?", (job['id'],))
-            if cursor.fetchone():
-                dup_count += 1
-                continue
-            
-            # Build insert with proper handling
-            try:
-                cursor.execute("""
-                    INSERT INTO jobs (id, title, company, location, work_type, job_level, 
-                        experience, experience_min, experience_max, salary_raw, salary_min, 
-                        salary_max, salary_normalized, description, skills, source, url, 
-                        posted_date, status, is_bookmarked, match_score, created_at, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    job['id'], job['title'], job['company'], job['location'],
-                    job.get('work_type', ''), job.get('level', ''),
-                    job.get('experience', ''), job.get('experience_min', 0), job.get('experience_max', 0),
-                    job.get('salary', ''), job.get('salary_min', 0), job.get('salary_max', 0),
-                    job.get('salary', ''), job.get('description', ''),
-                    json.dumps(job.get('skills', [])), job.get('source', ''), job.get('url', ''),
-                    job.get('posted_date', ''), job.get('status', 'new'),
-                    1 if job.get('is_bookmarked') else 0, 50,
-                    job.get('created_at', datetime.now().isoformat()),
-                    datetime.now().isoformat()
-                ))
-                new_count += 1
-            except Exception as insert_err:
-                logger.error(f"Insert error for job {job.get('id')}: {insert_err}")
-                continue
-        
-        conn.commit()
+        # One transaction, one statement: existing ids are skipped by the primary key
+        # instead of a SELECT round-trip per job
+        conn = get_db()
+        with conn:
+            before = conn.total_changes
+            conn.executemany("""
+                INSERT OR IGNORE INTO jobs (id, title, company, location, work_type, job_level, 
+                    experience, experience_min, experience_max, salary_raw, salary_min, 
+                    salary_max, salary_normalized, description, skills, source, url, 
+                    posted_date, status, is_bookmarked, match_score, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+            new_count = conn.total_changes - before
         conn.close()
+        dup_count = len(rows) - new_count
         
         with status_lock:
             scraper_status.update({
@@ -1760,7 +1775,7 @@ async def start_scrape(request: ScrapeRequest, background_tasks: BackgroundTasks
             "progress": 0
         })
     
-    background_tasks.add_task(run_scraper_task, request.locations, request.days, request.pages, request.sources)
+    background_tasks.add_task(run_scraper_task, request.locations, request.days, request.pages, request.sources, request.refresh_cache)
     return {"message": "Scraping started", "status": scraper_status}
 
 @app.get("/api/scrape/status")
@@ -1769,7 +1784,7 @@ async def get_scrape_status():
 
 # User Profile
 @app.get("/api/profile")
-async def get_profile():
+def get_profile():
     conn = get_db()
     cursor = conn.cursor()
     cursor.execute("SELECT * FROM user_profile ORDER BY id DESC LIMIT 1")
@@ -1794,7 +1809,7 @@ async def get_profile():
     }
 
 @app.post("/api/profile")
-async def save_profile(profile: UserProfileRequest):
+def save_profile(profile: UserProfileRequest):
     conn = get_db()
     cursor = conn.cursor()
     
@@ -1820,7 +1835,7 @@ async def save_profile(profile: UserProfileRequest):
 
 # Interview Prep
 @app.get("/api/interview-prep/{job_id}")
-async def get_interview_prep(job_id: str):
+def get_interview_prep(job_id: str):
     conn = get_db()
     cursor = conn.cursor()
     
@@ -1851,7 +1866,7 @@ async def get_interview_prep(job_id: str):
     return dict(row)
 
 @app.post("/api/interview-prep")
-async def save_interview_prep(prep: InterviewPrepRequest):
+def save_interview_prep(prep: InterviewPrepRequest):
     conn = get_db()
     cursor = conn.cursor()
     
@@ -1872,7 +1887,7 @@ async def save_interview_prep(prep: InterviewPrepRequest):
 
 # Reminders
 @app.get("/api/reminders")
-async def get_reminders(include_completed: bool = False):
+def get_reminders(include_completed: bool = False):
     conn = get_db()
     cursor = conn.cursor()
     
@@ -1898,7 +1913,7 @@ async def get_reminders(include_completed: bool = False):
     return [dict(row) for row in rows]
 
 @app.post("/api/reminders")
-async def create_reminder(reminder: ReminderRequest):
+def create_reminder(reminder: ReminderRequest):
     conn = get_db()
     cursor = conn.cursor()
     
@@ -1914,7 +1929,7 @@ async def create_reminder(reminder: ReminderRequest):
     return {"success": True}
 
 @app.patch("/api/reminders/{reminder_id}")
-async def complete_reminder(reminder_id: int):
+def complete_reminder(reminder_id: int):
     conn = get_db()
     cursor = conn.cursor()
     cursor.execute("UPDATE reminders SET is_completed = 1 WHERE id = ?", (reminder_id,))
@@ -1924,7 +1939,7 @@ async def complete_reminder(reminder_id: int):
 
 # Export
 @app.get("/api/export/csv")
-async def export_csv(status: Optional[str] = None):
+def export_csv(status: Optional[str] = None):
     conn = get_db()
     cursor = conn.cursor()
     
@@ -1961,7 +1976,7 @@ async def export_csv(status: Optional[str] = None):
 
 # Helper endpoints
 @app.get("/api/sources")
-async def get_sources():
+def get_sources():
     # Return all available sources (both from DB and available scrapers)
     all_sources = [
         {"id": "linkedin", "name": "LinkedIn", "enabled": True, "description": "Professional network jobs"},
@@ -1991,7 +2006,7 @@ async def get_sources():
     return all_sources
 
 @app.get("/api/locations")
-async def get_locations():
+def get_locations():
     conn = get_db()
     cursor = conn.cursor()
     cursor.execute("SELECT location FROM jobs WHERE location != '' GROUP BY location ORDER BY COUNT(*) DESC LIMIT 50")
@@ -2000,7 +2015,7 @@ async def get_locations():
     return locations
 
 @app.get("/api/companies")
-async def get_companies():
+def get_companies():
     conn = get_db()
     cursor = conn.cursor()
     cursor.execute("SELECT company FROM jobs WHERE company != '' GROUP BY company ORDER BY COUNT(*) DESC LIMIT 100")
@@ -2010,7 +2025,7 @@ async def get_companies():
 
 # Bulk operations
 @app.post("/api/jobs/bulk-update")
-async def bulk_update_jobs(job_ids: List[str], update: UpdateJobRequest):
+def bulk_update_jobs(job_ids: List[str], update: UpdateJobRequest):
     conn = get_db()
     cursor = conn.cursor()
     
@@ -19,17 +19,51 @@ SOLUTIONS IMPLEMENTED:
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import re
 import time
 import random
+import gzip
 import hashlib
+import itertools
 import logging
+import os
+import threading
 from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
 from typing import List, Dict, Any, Optional
-from urllib.parse import quote, urlencode
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+import multiprocessing
+from urllib.parse import quote, urlencode, urlparse
 import json
 
+# orjson parses straight from bytes and is several times faster; stdlib is the fallback
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+# lxml's C parser is several times faster than html.parser and supports the same strainers
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Optional HTTP/2 transport (pip install 'httpx[http2]'), enabled with SCRAPER_HTTP2=1
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 logger = logging.getLogger(__name__)
 
 # ============================================================================
@@ -52,6 +86,48 @@ USER_AGENTS = [
     'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0',
 ]
 
+# Browser-like headers set once per session; only the User-Agent rotates
+DEFAULT_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'Cache-Control': 'max-age=0',
+}
+
+# Pick a fresh User-Agent every N requests (and whenever we get blocked)
+ROTATE_EVERY = 25
+
+# Keep-alive pool sizing: one pool per job-board host, a few sockets each
+POOL_HOSTS = 20
+POOL_PER_HOST = 10
+
+# scrape_all concurrency: total worker threads, and in-flight requests allowed per board
+MAX_SCRAPE_WORKERS = 8
+PER_HOST_CONCURRENCY = 2
+
+# Opt-in: run work units in N spawned processes so parsing escapes the GIL.
+# Each process has its own session and per-host limits, so keep N small.
+SCRAPE_PROCESSES = int(os.environ.get('SCRAPER_PROCESSES', '0') or 0)
+
+# Retry backoff bases in seconds (doubled per attempt, jittered, capped)
+RATE_LIMIT_BACKOFF = 60   # 429/503 without Retry-After: first wait 30-60s
+ERROR_BACKOFF = 5         # timeouts / connection errors: first wait 2.5-5s
+MAX_BACKOFF = 300
+
+# Raw search pages are cached on disk; boards rarely update more than hourly
+HTTP_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'http_cache')
+HTTP_CACHE_TTL = 6 * 60 * 60  # seconds
+
+# HTTP/2 multiplexes a board's page fetches over one TLS connection; off by default
+HTTP2_ENABLED = os.environ.get('SCRAPER_HTTP2', '').lower() in ('1', 'true', 'yes')
+HTTP1_ONLY_HOSTS = ('timesjobs.com',)  # rejects HTTP/2 requests
+
 # ============================================================================
 # PM JOB DETECTION
 # ============================================================================
@@ -72,6 +148,37 @@ EXCLUDE_KEYWORDS = [
     'operations manager', 'facility manager', 'warehouse manager',
 ]
 
+
+def _trie_regex(words) -> str:
+    """
+    Build a prefix-factored alternation, e.g. 'product (?:manager|owner)'.
+    A flat 'a|b|c' makes re retry every keyword at every position; the trie
+    shares prefixes so each character is examined once per position, like an
+    Aho-Corasick pass. Greedy optional tails keep longest-match semantics.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = {}  # end-of-word marker
+    
+    def build(node) -> str:
+        alts = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not alts:
+            return ''
+        optional = '' in node
+        if len(alts) == 1 and not optional:
+            return alts[0]
+        return '(?:' + '|'.join(alts) + ')' + ('?' if optional else '')
+    
+    return build(trie)
+
+
+# Single-pass substring matchers (same semantics as `any(kw in title ...)`)
+_PM_RE = re.compile(_trie_regex(PM_KEYWORDS))
+_EXCLUDE_RE = re.compile(_trie_regex(EXCLUDE_KEYWORDS))
+
 PM_SKILLS = [
     'sql', 'python', 'analytics', 'a/b testing', 'agile', 'scrum', 'jira',
     'roadmap', 'user research', 'data analysis', 'metrics', 'kpi', 'okr',
@@ -89,6 +196,86 @@ PM_SKILLS = [
     'leadership', 'strategy', 'vision', 'execution', 'cross-functional'
 ]
 
+# One scan for every skill. The lookahead keeps matches zero-width so nested
+# skills ('analytics' inside 'google analytics') are still reported; the trie's
+# greedy tails make the full phrase win at a shared start position.
+SKILL_RE = re.compile(r'\b(?=(' + _trie_regex(PM_SKILLS) + r')\b)')
+
+# Seniority ladder - checked top to bottom, first tier that matches wins
+LEVEL_KEYWORDS = (
+    ("👑 Executive", ('chief', 'cpo', 'cxo', 'c-level')),
+    ("🎯 VP/Head", ('vp', 'vice president', 'head of')),
+    ("📊 Director", ('director',)),
+    ("⭐ Principal/GPM", ('principal', 'group', 'gpm')),
+    ("🔵 Senior/Lead", ('staff', 'lead', 'senior', 'sr.', 'sr ', 'spm', 'iii', ' 3')),
+    ("🟢 Entry/APM", ('associate', 'apm', 'junior', 'jr', 'entry', ' i', ' 1', 'intern')),
+)
+
+WORK_TYPE_KEYWORDS = (
+    ("🏠 Remote", ('remote', 'work from home', 'wfh', 'anywhere', 'distributed')),
+    ("🔄 Hybrid", ('hybrid', 'flexible', 'partial remote', '2 days', '3 days')),
+    ("🏢 On-site", ('on-site', 'onsite', 'office', 'in-office', 'in office')),
+)
+
+
+def _compile_ladder(ladder):
+    """Compile each tier's keywords into one alternation regex (substring semantics)"""
+    return tuple(
+        (re.compile('|'.join(re.escape(kw) for kw in keywords)), label)
+        for label, keywords in ladder
+    )
+
+
+_LEVEL_PATTERNS = _compile_ladder(LEVEL_KEYWORDS)
+_WORK_TYPE_PATTERNS = _compile_ladder(WORK_TYPE_KEYWORDS)
+
+# Salary unit -> (priority, multiplier to LPA); lower priority wins when several appear
+SALARY_UNITS = {
+    'lpa': (0, 1), 'lac': (0, 1), 'lakh': (0, 1),
+    'cr': (1, 100),
+    'k': (2, 0.12),   # Monthly to LPA approximation
+    '$': (3, 0.83),   # USD - convert to INR LPA (rough), 1 USD ~= 83 INR
+}
+_SALARY_UNIT_RE = re.compile('|'.join(re.escape(u) for u in sorted(SALARY_UNITS, key=len, reverse=True)))
+_NUMBER_RE = re.compile(r'(\d+(?:\.\d+)?)')
+
+# The same handful of queries/locations get URL-quoted on every page of every source
+_quote = lru_cache(maxsize=1024)(quote)
+
+# ============================================================================
+# PARTIAL PARSING - Only build the DOM for job card subtrees
+# ============================================================================
+
+# Each strainer is a superset of that source's card selectors, so the usual
+# fallback chains still run unchanged on the (much smaller) parsed tree.
+# Class rules are regexes because bs4 >= 4.13 matches the raw attribute string.
+NAUKRI_CARDS = SoupStrainer(['article', 'div'], class_=re.compile(r'jobTuple|srp-jobtuple-wrapper|job-tuple'))
+FOUNDIT_CARDS = SoupStrainer('div', class_=re.compile(r'card-apply-content'))
+INTERNSHALA_CARDS = SoupStrainer('div', class_=re.compile(r'individual_internship|job-internship'))
+INSTAHYRE_CARDS = SoupStrainer('div', class_=re.compile(r'employer-row'))
+WELLFOUND_CARDS = SoupStrainer('div', class_=re.compile(r'styles_jobListing|job-listing|job-link'))
+TIMESJOBS_CARDS = SoupStrainer('li', class_=re.compile(r'job-bx'))
+SHINE_CARDS = SoupStrainer('div', class_=re.compile(r'job_card_content'))
+
+# Class-substring matchers shared by the fallback selector chains
+_TITLE_CLASS = re.compile(r'title')
+_COMPANY_CLASS = re.compile(r'company')
+_LOCATION_CLASS = re.compile(r'location')
+_SALARY_CLASS = re.compile(r'salary')
+_EXPERIENCE_CLASS = re.compile(r'experience')
+_JOB_INTERNSHIP_CLASS = re.compile(r'job-internship')
+_STYLES_JOB_LISTING_CLASS = re.compile(r'styles_jobListing')
+_JOB_LISTING_CLASS = re.compile(r'job-listing')
+_JOB_CARD_CLASS = re.compile(r'job-card')
+_JOBCARD_CLASS = re.compile(r'JobCard')
+
+# Relative dates ("3 days ago") and experience ranges ("2-5 yrs")
+_DAYS_AGO_RE = re.compile(r'(\d+)\s*day')
+_WEEKS_AGO_RE = re.compile(r'(\d+)\s*week')
+_MONTHS_AGO_RE = re.compile(r'(\d+)\s*month')
+_EXP_RANGE_RE = re.compile(r'(\d+)\s*[-–to]\s*(\d+)')
+_FIRST_INT_RE = re.compile(r'(\d+)')
+
 
 class UltimateJobScraper:
     """
@@ -111,79 +298,299 @@ class UltimateJobScraper:
         "director product management"
     ]
     
-    def __init__(self):
+    # Which scrape args actually change the fetched pages; default is both.
+    # Repeating a unit with the same values would just refetch identical pages.
+    SOURCE_KEY_ARGS = {
+        'wellfound': (),               # fixed product-manager role page
+        'internshala': ('query',),     # no location filter in the URL
+        'glassdoor': ('query',),       # URL is hardcoded to all of India
+        'cutshort': ('location',),     # fixed product-manager listing per city
+    }
+    
+    def __init__(self, cache_dir: Optional[str] = HTTP_CACHE_DIR, refresh_cache: bool = False):
+        """
+        Args:
+            cache_dir: Where raw responses are cached (None disables the cache)
+            refresh_cache: Skip cache lookups but still write fresh responses
+        """
+        self.cache_dir = cache_dir
+        self.refresh_cache = refresh_cache
         self.session = requests.Session()
+        # Default pool keeps 10 hosts; we hit 11+, so connections got evicted and re-handshaked.
+        # Dropped/refused connections are retried in the pool; HTTP statuses stay with _make_request.
+        adapter = HTTPAdapter(
+            pool_connections=POOL_HOSTS,
+            pool_maxsize=POOL_PER_HOST,
+            max_retries=Retry(total=2, connect=2, read=0, status=0, other=0, backoff_factor=0.5),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update(DEFAULT_HEADERS)
+        self.http2_client = self._make_http2_client() if HTTP2_ENABLED else None
+        # Sources run in parallel threads: the counter is atomic, and the politeness clock is
+        # per host (earliest next request time, shared by every thread hitting that board)
+        self._request_counter = itertools.count(1)
+        self._local = threading.local()
+        self._host_slots = {}
+        self._host_next_ok = {}
+        self._host_slots_lock = threading.Lock()
+        # Raw (pre-dedup) job count of the last scrape_all, for progress reporting
+        self.last_raw_count = 0
         self._rotate_user_agent()
         
+    @staticmethod
+    def _make_http2_client():
+        """Shared httpx HTTP/2 client, or None if httpx/h2 aren't installed"""
+        try:
+            if httpx is None:
+                raise ImportError("httpx")
+            transport = httpx.HTTPTransport(
+                http2=True,
+                retries=2,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=POOL_HOSTS),
+            )
+            return httpx.Client(transport=transport, headers=DEFAULT_HEADERS, follow_redirects=True)
+        except ImportError:
+            logger.warning("SCRAPER_HTTP2 is set but httpx[http2] is not installed, using requests")
+            return None
+    
+    def _client_for(self, url: str):
+        """HTTP/2 client when enabled and the host supports it, else the requests session"""
+        if self.http2_client is not None and not any(host in url for host in HTTP1_ONLY_HOSTS):
+            return self.http2_client
+        return self.session
+    
+    def _host_slot(self, host: str) -> threading.BoundedSemaphore:
+        """Semaphore capping concurrent requests to host"""
+        with self._host_slots_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(PER_HOST_CONCURRENCY)
+        return slot
+    
     def _rotate_user_agent(self):
         """Change User-Agent to avoid detection"""
-        ua = random.choice(USER_AGENTS)
-        self.session.headers.update({
-            'User-Agent': ua,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Sec-Fetch-User': '?1',
-            'Cache-Control': 'max-age=0',
-        })
+        # Sent per request rather than stored on the shared session headers
+        self._user_agent = random.choice(USER_AGENTS)
     
-    def _smart_delay(self, min_sec=1.5, max_sec=4.0):
-        """Human-like random delay"""
+    @staticmethod
+    def _polite_gap(min_sec=1.5, max_sec=4.0) -> float:
+        """Human-like random gap between two requests to the same board"""
         delay = random.uniform(min_sec, max_sec)
         # Occasionally add extra delay (like a human getting distracted)
         if random.random() < 0.1:
             delay += random.uniform(2, 5)
-        time.sleep(delay)
+        return delay
     
-    def _make_request(self, url: str, retries: int = 3) -> Optional[requests.Response]:
-        """Make request with retries and rotation"""
+    def _smart_delay(self, min_sec=1.5, max_sec=4.0):
+        """Keep the board this thread last hit idle for a human-like gap after that request.
+        
+        Doesn't sleep here: the next request to that host (from any thread) waits it out in
+        _wait_for_host, so parse time counts toward the gap.
+        """
+        host = getattr(self._local, 'last_host', None)
+        if host is None:
+            return
+        not_before = self._local.last_request_at + self._polite_gap(min_sec, max_sec)
+        with self._host_slots_lock:
+            self._host_next_ok[host] = max(self._host_next_ok.get(host, 0.0), not_before)
+    
+    def _make_request(self, url: str, retries: int = 3, headers: Optional[Dict] = None,
+                      params: Optional[Dict] = None) -> Optional[requests.Response]:
+        """Make request with retries and rotation (served from the disk cache when fresh)"""
+        cached = self._cache_get(url, params)
+        if cached is not None:
+            return cached
+        
+        host = urlparse(url).netloc
         for attempt in range(retries):
+            more_attempts = attempt + 1 < retries
             try:
-                self._rotate_user_agent()
-                response = self.session.get(url, timeout=20)
+                # Rotating on every call is pure overhead; refresh periodically and when blocked
+                if next(self._request_counter) % ROTATE_EVERY == 0:
+                    self._rotate_user_agent()
+                self._wait_for_host(host)
+                client = self._client_for(url)
+                with self._host_slot(host):
+                    response = client.get(url, params=params, headers={'User-Agent': self._user_agent, **(headers or {})}, timeout=20)
+                self._local.last_request_at = time.monotonic()
+                self._local.last_host = host
                 
                 if response.status_code == 200:
+                    # Without a declared charset requests falls back to latin-1 or runs
+                    # charset detection over the whole body; these boards all serve utf-8
+                    if 'charset' not in response.headers.get('Content-Type', '').lower():
+                        response.encoding = 'utf-8'
+                    self._cache_put(url, params, response)
                     return response
-                elif response.status_code == 429:  # Rate limited
-                    logger.warning(f"Rate limited, waiting... (attempt {attempt + 1})")
-                    time.sleep(30 + random.uniform(0, 30))
+                elif response.status_code in (429, 503):  # Rate limited / overloaded
+                    delay = self._backoff(attempt, RATE_LIMIT_BACKOFF, response.headers.get('Retry-After'))
+                    logger.warning(f"Rate limited ({response.status_code}) by {host}, holding {delay:.0f}s... (attempt {attempt + 1})")
+                    self._rotate_user_agent()
+                    # Every worker on this host waits out the same window before its next request
+                    self._hold_host(host, delay)
                 elif response.status_code == 403:  # Blocked
                     logger.warning(f"Blocked (403), rotating agent... (attempt {attempt + 1})")
+                    self._rotate_user_agent()
                     self._smart_delay(5, 10)
                 else:
                     logger.warning(f"Got status {response.status_code} for {url}")
                     
             except requests.exceptions.Timeout:
                 logger.warning(f"Timeout for {url} (attempt {attempt + 1})")
-                self._smart_delay(2, 5)
+                if more_attempts:
+                    time.sleep(self._backoff(attempt, ERROR_BACKOFF))
             except Exception as e:
                 logger.error(f"Request error: {e}")
-                self._smart_delay(2, 5)
+                if more_attempts:
+                    time.sleep(self._backoff(attempt, ERROR_BACKOFF))
         
+        # Scrapers swallow failed pages; count them so _scrape_unit won't cache a partial result
+        self._local.failed_requests = getattr(self._local, 'failed_requests', 0) + 1
         return None
     
-    def _clean(self, text: str) -> str:
-        """Clean text"""
+    @staticmethod
+    def _backoff(attempt: int, base: float, retry_after: Optional[str] = None) -> float:
+        """Seconds to wait: the server's Retry-After if sent, else exponential backoff with jitter"""
+        if retry_after:
+            try:
+                return min(max(float(retry_after), 0.0), MAX_BACKOFF)
+            except ValueError:
+                try:
+                    when = parsedate_to_datetime(retry_after)
+                    return min(max((when - datetime.now(when.tzinfo)).total_seconds(), 0.0), MAX_BACKOFF)
+                except (TypeError, ValueError):
+                    pass
+        delay = min(base * 2 ** attempt, MAX_BACKOFF)
+        return random.uniform(delay / 2, delay)
+    
+    def _hold_host(self, host: str, delay: float):
+        """Push back the earliest time any thread may hit host again"""
+        with self._host_slots_lock:
+            self._host_next_ok[host] = max(self._host_next_ok.get(host, 0.0), time.monotonic() + delay)
+    
+    def _wait_for_host(self, host: str):
+        """Sleep until host's next free turn, booking the one after it a polite gap later.
+        
+        Turns are handed out under the lock, so requests to one board start at least
+        _polite_gap() apart however many threads are working on it; rate-limit holds
+        and _smart_delay only push the next turn further out.
+        """
+        with self._host_slots_lock:
+            now = time.monotonic()
+            start = max(now, self._host_next_ok.get(host, 0.0))
+            self._host_next_ok[host] = start + self._polite_gap()
+        if start > now:
+            time.sleep(start - now)
+    
+    # ========================================================================
+    # HTTP CACHE - gzipped raw bodies on disk, keyed by URL + params
+    # ========================================================================
+    
+    def _cache_path(self, url: str, params: Optional[Dict]) -> str:
+        key = url + ('?' + urlencode(params) if params else '')
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode()).hexdigest() + '.gz')
+    
+    def _cache_get(self, url: str, params: Optional[Dict] = None) -> Optional[requests.Response]:
+        """Return a cached response younger than HTTP_CACHE_TTL, if any"""
+        if not self.cache_dir or self.refresh_cache:
+            return None
+        path = self._cache_path(url, params)
+        try:
+            if time.time() - os.path.getmtime(path) > HTTP_CACHE_TTL:
+                return None
+            with gzip.open(path, 'rb') as f:
+                encoding, _, body = f.read().partition(b'\n')
+        except OSError:
+            return None
+        
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response._content = body
+        response.encoding = encoding.decode() or 'utf-8'
+        return response
+    
+    def _cache_put(self, url: str, params: Optional[Dict], response: requests.Response):
+        """Store a successful response body; the first line records its encoding"""
+        if not self.cache_dir:
+            return
+        payload = (response.encoding or '').encode() + b'\n' + response.content
+        self._write_cache_file(self._cache_path(url, params), payload)
+    
+    @staticmethod
+    def _write_cache_file(path: str, payload: bytes):
+        """Gzip payload to path atomically, so parallel sources never read half a file"""
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with gzip.open(tmp_path, 'wb', compresslevel=5) as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write cache file {path}: {e}")
+    
+    def _processed_cache_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, 'processed', hashlib.sha1(key.encode()).hexdigest() + '.json.gz')
+    
+    def _prune_cache(self):
+        """Delete raw pages older than HTTP_CACHE_TTL and processed results from before today"""
+        if not self.cache_dir:
+            return
+        midnight = datetime.combine(datetime.now().date(), datetime.min.time()).timestamp()
+        cutoffs = (
+            (self.cache_dir, time.time() - HTTP_CACHE_TTL),
+            (os.path.join(self.cache_dir, 'processed'), midnight),  # keys are per day
+        )
+        removed = 0
+        for directory, cutoff in cutoffs:
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+                        removed += 1
+                except OSError:
+                    pass
+        if removed:
+            logger.info(f"Pruned {removed} expired cache files")
+    
+    def _parse_html(self, response: requests.Response, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """Parse a response body, keeping only the subtrees matched by parse_only"""
+        return BeautifulSoup(response.text, HTML_PARSER, parse_only=parse_only)
+    
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _clean(text: str) -> str:
+        """Clean text (memoized - company/location strings repeat across cards)"""
         if not text:
             return ""
         return ' '.join(text.strip().split())
     
     def _generate_job_id(self, title: str, company: str, location: str) -> str:
-        """Generate unique job ID"""
-        unique_str = f"{title.lower()}|{company.lower()}|{location.lower()}"
+        """
+        Generate unique job ID.
+        Deliberately stays MD5: IDs are the jobs table's primary key, so a new hash
+        would re-insert every stored job as new. One lower() on the joined string
+        gives the same result as lowering each field.
+        """
+        unique_str = f"{title}|{company}|{location}".lower()
         return hashlib.md5(unique_str.encode()).hexdigest()[:12]
     
-    def _is_pm_job(self, title: str) -> bool:
-        """Check if job title is a PM role"""
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _is_pm_job(title: str) -> bool:
+        """
+        Check if job title is a PM role (memoized - titles repeat across sources).
+        Scrapers call this right after reading the title so rejected cards never
+        pay for company/location/salary lookups; lowering happens inside the
+        cache, so each distinct title is lowered once.
+        """
         title_lower = title.lower()
-        is_pm = any(kw in title_lower for kw in PM_KEYWORDS)
-        is_excluded = any(kw in title_lower for kw in EXCLUDE_KEYWORDS)
-        return is_pm and not is_excluded
+        return bool(_PM_RE.search(title_lower)) and not _EXCLUDE_RE.search(title_lower)
     
     def _parse_date(self, text: str) -> str:
         """Parse relative date to absolute date"""
@@ -198,15 +605,15 @@ class UltimateJobScraper:
             return (today - timedelta(days=1)).strftime("%Y-%m-%d")
         
         # Try to parse "X days ago"
-        match = re.search(r'(\d+)\s*day', text)
+        match = _DAYS_AGO_RE.search(text)
         if match:
             return (today - timedelta(days=int(match.group(1)))).strftime("%Y-%m-%d")
         
-        match = re.search(r'(\d+)\s*week', text)
+        match = _WEEKS_AGO_RE.search(text)
         if match:
             return (today - timedelta(weeks=int(match.group(1)))).strftime("%Y-%m-%d")
         
-        match = re.search(r'(\d+)\s*month', text)
+        match = _MONTHS_AGO_RE.search(text)
         if match:
             return (today - timedelta(days=int(match.group(1)) * 30)).strftime("%Y-%m-%d")
         
@@ -222,79 +629,82 @@ class UltimateJobScraper:
         """Extract PM skills from text"""
         if not text:
             return []
-        text = text.lower()
-        found = []
-        for skill in PM_SKILLS:
-            if re.search(r'\b' + re.escape(skill) + r'\b', text):
-                found.append(skill)
-        return list(set(found))[:15]
+        return list(self._match_skills(text))
     
-    def _detect_work_type(self, text: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _match_skills(text: str) -> tuple:
+        """Memoized skill scan; returns a tuple so cached results can't be mutated"""
+        # dict.fromkeys dedupes while keeping first-seen order
+        return tuple(dict.fromkeys(SKILL_RE.findall(text.lower())))[:15]
+    
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _detect_work_type(text: str) -> str:
         """Detect remote/hybrid/onsite"""
         text = text.lower()
-        if any(w in text for w in ['remote', 'work from home', 'wfh', 'anywhere', 'distributed']):
-            return "🏠 Remote"
-        if any(w in text for w in ['hybrid', 'flexible', 'partial remote', '2 days', '3 days']):
-            return "🔄 Hybrid"
-        if any(w in text for w in ['on-site', 'onsite', 'office', 'in-office', 'in office']):
-            return "🏢 On-site"
+        for pattern, label in _WORK_TYPE_PATTERNS:
+            if pattern.search(text):
+                return label
         return "📍 Not Specified"
     
-    def _detect_level(self, title: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _detect_level(title: str) -> str:
         """Detect seniority level"""
         title = title.lower()
-        if any(x in title for x in ['chief', 'cpo', 'cxo', 'c-level']):
-            return "👑 Executive"
-        if any(x in title for x in ['vp', 'vice president', 'head of']):
-            return "🎯 VP/Head"
-        if 'director' in title:
-            return "📊 Director"
-        if any(x in title for x in ['principal', 'group', 'gpm']):
-            return "⭐ Principal/GPM"
-        if any(x in title for x in ['staff', 'lead', 'senior', 'sr.', 'sr ', 'spm', 'iii', ' 3']):
-            return "🔵 Senior/Lead"
-        if any(x in title for x in ['associate', 'apm', 'junior', 'jr', 'entry', ' i', ' 1', 'intern']):
-            return "🟢 Entry/APM"
+        for pattern, label in _LEVEL_PATTERNS:
+            if pattern.search(title):
+                return label
         return "🔷 Mid-Level"
     
-    def _parse_salary(self, text: str) -> tuple:
-        """Parse salary text to min, max, normalized string"""
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_salary(text: str) -> tuple:
+        """Parse salary text to min, max, normalized string (memoized - few distinct strings)"""
         if not text:
             return 0, 0, ""
         text = text.lower().replace(',', '').replace(' ', '')
         
-        try:
-            numbers = re.findall(r'(\d+(?:\.\d+)?)', text)
-            if not numbers:
-                return 0, 0, ""
-            
-            multiplier = 1
-            if 'lpa' in text or 'lac' in text or 'lakh' in text:
-                multiplier = 1
-            elif 'cr' in text or 'crore' in text:
-                multiplier = 100
-            elif 'k' in text:
-                multiplier = 0.12  # Monthly to LPA approximation
-            elif '$' in text:
-                # USD - convert to INR LPA (rough)
-                multiplier = 0.83  # 1 USD ~= 83 INR, then /100000 for LPA
-            
-            numbers = [float(n) * multiplier for n in numbers[:2]]
-            min_sal = min(numbers)
-            max_sal = max(numbers) if len(numbers) > 1 else min_sal
-            
-            if max_sal > 500:  # Probably monthly or wrong format
-                min_sal = min_sal * 12 / 100000
-                max_sal = max_sal * 12 / 100000
-            
-            if min_sal == max_sal:
-                normalized = f"₹{min_sal:.0f} LPA"
-            else:
-                normalized = f"₹{min_sal:.0f}-{max_sal:.0f} LPA"
-            
-            return min_sal, max_sal, normalized
-        except:
+        numbers = _NUMBER_RE.findall(text)
+        if not numbers:
+            return 0, 0, ""
+        
+        # Strongest unit mentioned anywhere wins (lakh > crore > k > $)
+        units = _SALARY_UNIT_RE.findall(text)
+        multiplier = min(map(SALARY_UNITS.get, units))[1] if units else 1
+        
+        numbers = [float(n) * multiplier for n in numbers[:2]]
+        min_sal = min(numbers)
+        max_sal = max(numbers) if len(numbers) > 1 else min_sal
+        
+        if max_sal > 500:  # Probably monthly or wrong format
+            min_sal = min_sal * 12 / 100000
+            max_sal = max_sal * 12 / 100000
+        
+        if min_sal == max_sal:
+            normalized = f"₹{min_sal:.0f} LPA"
+        else:
+            normalized = f"₹{min_sal:.0f}-{max_sal:.0f} LPA"
+        
+        return min_sal, max_sal, normalized
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_experience(text: str) -> tuple:
+        """Parse experience text to min, max, display string (memoized)"""
+        if not text:
             return 0, 0, ""
+        match = _EXP_RANGE_RE.search(text.lower().replace(' ', ''))
+        if match:
+            exp_min = int(match.group(1))
+            exp_max = int(match.group(2))
+            return exp_min, exp_max, f"{exp_min}-{exp_max} yrs"
+        match = _FIRST_INT_RE.search(text)
+        if match:
+            exp_min = int(match.group(1))
+            return exp_min, exp_min + 3, f"{exp_min}+ yrs"
+        return 0, 0, ""
 
     # ========================================================================
     # SOURCE 1: LINKEDIN (Public Jobs)
@@ -312,13 +722,13 @@ class UltimateJobScraper:
             try:
                 # LinkedIn public jobs API endpoint
                 start = page * 25
-                url = f"https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search?keywords={quote(query)}&location={quote(location)}&start={start}&f_TPR=r604800"
+                url = f"https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search?keywords={_quote(query)}&location={_quote(location)}&start={start}&f_TPR=r604800"
                 
                 response = self._make_request(url)
                 if not response:
                     continue
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = self._parse_html(response)
                 
                 # Multiple selector fallbacks
                 cards = (
@@ -328,55 +738,51 @@ class UltimateJobScraper:
                 )
                 
                 for card in cards:
-                    try:
-                        # Title - multiple fallbacks
-                        title_elem = (
-                            card.find('h3', class_='base-search-card__title') or
-                            card.find('h3') or
-                            card.find('a', class_='base-card__full-link')
-                        )
-                        if not title_elem:
-                            continue
-                            
-                        title = self._clean(title_elem.text)
-                        if not title or not self._is_pm_job(title):
-                            continue
-                        
-                        # Company
-                        company_elem = (
-                            card.find('h4', class_='base-search-card__subtitle') or
-                            card.find('a', class_='hidden-nested-link') or
-                            card.find('h4')
-                        )
-                        company = self._clean(company_elem.text) if company_elem else ''
-                        
-                        # Location
-                        loc_elem = (
-                            card.find('span', class_='job-search-card__location') or
-                            card.find('span', class_='bullet') or
-                            card.find('span', {'class': re.compile(r'location')})
-                        )
-                        loc = self._clean(loc_elem.text) if loc_elem else location
-                        
-                        # URL
-                        link = card.find('a', class_='base-card__full-link') or card.find('a', href=True)
-                        url = link.get('href', '') if link else ''
-                        
-                        # Date
-                        date_elem = card.find('time')
-                        posted_raw = date_elem.get('datetime', '') if date_elem else ''
-                        
-                        jobs.append({
-                            'title': title,
-                            'company': company,
-                            'location': loc,
-                            'url': url,
-                            'source': 'LinkedIn',
-                            'posted_date_raw': posted_raw,
-                        })
+                    # Title - multiple fallbacks
+                    title_elem = (
+                        card.find('h3', class_='base-search-card__title') or
+                        card.find('h3') or
+                        card.find('a', class_='base-card__full-link')
+                    )
+                    if not title_elem:
+                        continue
                         
-                    except Exception as e:
+                    title = self._clean(title_elem.text)
+                    if not title or not self._is_pm_job(title):
                         continue
+                    
+                    # Company
+                    company_elem = (
+                        card.find('h4', class_='base-search-card__subtitle') or
+                        card.find('a', class_='hidden-nested-link') or
+                        card.find('h4')
+                    )
+                    company = self._clean(company_elem.text) if company_elem else ''
+                    
+                    # Location
+                    loc_elem = (
+                        card.find('span', class_='job-search-card__location') or
+                        card.find('span', class_='bullet') or
+                        card.find('span', {'class': _LOCATION_CLASS})
+                    )
+                    loc = self._clean(loc_elem.text) if loc_elem else location
+                    
+                    # URL
+                    link = card.find('a', class_='base-card__full-link') or card.find('a', href=True)
+                    url = link.get('href', '') if link else ''
+                    
+                    # Date
+                    date_elem = card.find('time')
+                    posted_raw = date_elem.get('datetime', '') if date_elem else ''
+                    
+                    jobs.append({
+                        'title': title,
+                        'company': company,
+                        'location': loc,
+                        'url': url,
+                        'source': 'LinkedIn',
+                        'posted_date_raw': posted_raw,
+                    })
                 
                 self._smart_delay()
                 
@@ -402,13 +808,13 @@ class UltimateJobScraper:
             try:
                 start = page * 10
                 # Indeed India
-                url = f"https://in.indeed.com/jobs?q={quote(query)}&l={quote(location)}&start={start}&sort=date&fromage=14"
+                url = f"https://in.indeed.com/jobs?q={_quote(query)}&l={_quote(location)}&start={start}&sort=date&fromage=14"
                 
                 response = self._make_request(url)
                 if not response:
                     continue
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = self._parse_html(response)
                 
                 # Multiple selector fallbacks
                 cards = (
@@ -419,63 +825,59 @@ class UltimateJobScraper:
                 )
                 
                 for card in cards:
-                    try:
-                        # Title
-                        title_elem = (
-                            card.find('h2', class_='jobTitle') or
-                            card.find('a', {'data-testid': 'job-title'}) or
-                            card.find('span', {'title': True}) or
-                            card.find('h2')
-                        )
-                        if not title_elem:
-                            continue
-                            
-                        title = self._clean(title_elem.text)
-                        if not title or not self._is_pm_job(title):
-                            continue
-                        
-                        # Company
-                        company_elem = (
-                            card.find('span', {'data-testid': 'company-name'}) or
-                            card.find('span', class_='companyName') or
-                            card.find('span', class_='company')
-                        )
-                        company = self._clean(company_elem.text) if company_elem else ''
-                        
-                        # Location
-                        loc_elem = (
-                            card.find('div', {'data-testid': 'text-location'}) or
-                            card.find('div', class_='companyLocation') or
-                            card.find('span', class_='location')
-                        )
-                        loc = self._clean(loc_elem.text) if loc_elem else location
-                        
-                        # Salary
-                        salary_elem = (
-                            card.find('div', {'data-testid': 'attribute_snippet_testid'}) or
-                            card.find('span', class_='salary-snippet') or
-                            card.find('div', class_='salary-snippet-container')
-                        )
-                        salary = self._clean(salary_elem.text) if salary_elem else ''
-                        
-                        # URL
-                        link = card.find('a', href=True)
-                        job_url = ""
-                        if link:
-                            href = link.get('href', '')
-                            job_url = f"https://in.indeed.com{href}" if href.startswith('/') else href
-                        
-                        jobs.append({
-                            'title': title,
-                            'company': company,
-                            'location': loc,
-                            'url': job_url,
-                            'source': 'Indeed',
-                            'salary_raw': salary,
-                        })
+                    # Title
+                    title_elem = (
+                        card.find('h2', class_='jobTitle') or
+                        card.find('a', {'data-testid': 'job-title'}) or
+                        card.find('span', {'title': True}) or
+                        card.find('h2')
+                    )
+                    if not title_elem:
+                        continue
                         
-                    except Exception as e:
+                    title = self._clean(title_elem.text)
+                    if not title or not self._is_pm_job(title):
                         continue
+                    
+                    # Company
+                    company_elem = (
+                        card.find('span', {'data-testid': 'company-name'}) or
+                        card.find('span', class_='companyName') or
+                        card.find('span', class_='company')
+                    )
+                    company = self._clean(company_elem.text) if company_elem else ''
+                    
+                    # Location
+                    loc_elem = (
+                        card.find('div', {'data-testid': 'text-location'}) or
+                        card.find('div', class_='companyLocation') or
+                        card.find('span', class_='location')
+                    )
+                    loc = self._clean(loc_elem.text) if loc_elem else location
+                    
+                    # Salary
+                    salary_elem = (
+                        card.find('div', {'data-testid': 'attribute_snippet_testid'}) or
+                        card.find('span', class_='salary-snippet') or
+                        card.find('div', class_='salary-snippet-container')
+                    )
+                    salary = self._clean(salary_elem.text) if salary_elem else ''
+                    
+                    # URL
+                    link = card.find('a', href=True)
+                    job_url = ""
+                    if link:
+                        href = link.get('href', '')
+                        job_url = f"https://in.indeed.com{href}" if href.startswith('/') else href
+                    
+                    jobs.append({
+                        'title': title,
+                        'company': company,
+                        'location': loc,
+                        'url': job_url,
+                        'source': 'Indeed',
+                        'salary_raw': salary,
+                    })
                 
                 self._smart_delay()
                 
@@ -501,89 +903,85 @@ class UltimateJobScraper:
         for page in range(1, pages + 1):
             try:
                 # Naukri URL format
-                url = f"https://www.naukri.com/{query_slug}-jobs-in-{loc_slug}-{page}?k={quote(query)}&l={quote(location)}"
+                url = f"https://www.naukri.com/{query_slug}-jobs-in-{loc_slug}-{page}?k={_quote(query)}&l={_quote(location)}"
                 
                 response = self._make_request(url)
                 if not response:
                     continue
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = self._parse_html(response, NAUKRI_CARDS)
                 
                 # Multiple selector fallbacks
                 cards = (
                     soup.find_all('article', class_='jobTuple') or
                     soup.find_all('div', class_='srp-jobtuple-wrapper') or
-                    soup.find_all('div', {'class': re.compile(r'cust-job-tuple')}) or
-                    soup.find_all('div', {'class': re.compile(r'job-tuple')})
+                    soup.select('div[class*=cust-job-tuple]') or
+                    soup.select('div[class*=job-tuple]')
                 )
                 
                 for card in cards:
-                    try:
-                        # Title
-                        title_elem = (
-                            card.find('a', class_='title') or
-                            card.find('a', {'class': re.compile(r'title')}) or
-                            card.find('h2')
-                        )
-                        if not title_elem:
-                            continue
-                            
-                        title = self._clean(title_elem.text)
-                        if not title or not self._is_pm_job(title):
-                            continue
-                        
-                        # Company
-                        company_elem = (
-                            card.find('a', class_='subTitle') or
-                            card.find('a', {'class': re.compile(r'comp-name')}) or
-                            card.find('span', {'class': re.compile(r'comp')})
-                        )
-                        company = self._clean(company_elem.text) if company_elem else ''
-                        
-                        # Location
-                        loc_elem = (
-                            card.find('li', class_='location') or
-                            card.find('span', class_='locWdth') or
-                            card.find('span', {'class': re.compile(r'loc')})
-                        )
-                        loc = self._clean(loc_elem.text) if loc_elem else location
-                        
-                        # Experience
-                        exp_elem = (
-                            card.find('li', class_='experience') or
-                            card.find('span', class_='expwdth') or
-                            card.find('span', {'class': re.compile(r'exp')})
-                        )
-                        experience = self._clean(exp_elem.text) if exp_elem else ''
-                        
-                        # Salary
-                        sal_elem = (
-                            card.find('li', class_='salary') or
-                            card.find('span', class_='salWdth') or
-                            card.find('span', {'class': re.compile(r'sal')})
-                        )
-                        salary = self._clean(sal_elem.text) if sal_elem else ''
-                        
-                        # URL
-                        job_url = title_elem.get('href', '') if title_elem else ''
-                        
-                        # Skills
-                        skills_elem = card.find('ul', class_='tags') or card.find('div', class_='tags')
-                        skills_text = self._clean(skills_elem.text) if skills_elem else ''
-                        
-                        jobs.append({
-                            'title': title,
-                            'company': company,
-                            'location': loc,
-                            'url': job_url,
-                            'source': 'Naukri',
-                            'experience': experience,
-                            'salary_raw': salary,
-                            'skills_raw': skills_text,
-                        })
+                    # Title
+                    title_elem = (
+                        card.find('a', class_='title') or
+                        card.select_one('a[class*=title]') or
+                        card.find('h2')
+                    )
+                    if not title_elem:
+                        continue
                         
-                    except Exception as e:
+                    title = self._clean(title_elem.text)
+                    if not title or not self._is_pm_job(title):
                         continue
+                    
+                    # Company
+                    company_elem = (
+                        card.find('a', class_='subTitle') or
+                        card.select_one('a[class*=comp-name]') or
+                        card.select_one('span[class*=comp]')
+                    )
+                    company = self._clean(company_elem.text) if company_elem else ''
+                    
+                    # Location
+                    loc_elem = (
+                        card.find('li', class_='location') or
+                        card.find('span', class_='locWdth') or
+                        card.select_one('span[class*=loc]')
+                    )
+                    loc = self._clean(loc_elem.text) if loc_elem else location
+                    
+                    # Experience
+                    exp_elem = (
+                        card.find('li', class_='experience') or
+                        card.find('span', class_='expwdth') or
+                        card.select_one('span[class*=exp]')
+                    )
+                    experience = self._clean(exp_elem.text) if exp_elem else ''
+                    
+                    # Salary
+                    sal_elem = (
+                        card.find('li', class_='salary') or
+                        card.find('span', class_='salWdth') or
+                        card.select_one('span[class*=sal]')
+                    )
+                    salary = self._clean(sal_elem.text) if sal_elem else ''
+                    
+                    # URL
+                    job_url = title_elem.get('href', '') if title_elem else ''
+                    
+                    # Skills
+                    skills_elem = card.find('ul', class_='tags') or card.find('div', class_='tags')
+                    skills_text = self._clean(skills_elem.text) if skills_elem else ''
+                    
+                    jobs.append({
+                        'title': title,
+                        'company': company,
+                        'location': loc,
+                        'url': job_url,
+                        'source': 'Naukri',
+                        'experience': experience,
+                        'salary_raw': salary,
+                        'skills_raw': skills_text,
+                    })
                 
                 self._smart_delay()
                 
@@ -613,62 +1011,58 @@ class UltimateJobScraper:
                 if not response:
                     continue
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = self._parse_html(response)
                 
                 # Glassdoor job cards
                 cards = (
                     soup.find_all('li', {'data-test': 'jobListing'}) or
                     soup.find_all('li', class_='react-job-listing') or
-                    soup.find_all('div', {'class': re.compile(r'JobCard')})
+                    soup.select('div[class*=JobCard]')
                 )
                 
                 for card in cards:
-                    try:
-                        # Title
-                        title_elem = (
-                            card.find('a', {'data-test': 'job-link'}) or
-                            card.find('a', class_='jobLink') or
-                            card.find('div', {'data-test': 'job-title'})
-                        )
-                        if not title_elem:
-                            continue
-                            
-                        title = self._clean(title_elem.text)
-                        if not title or not self._is_pm_job(title):
-                            continue
-                        
-                        # Company
-                        company_elem = (
-                            card.find('div', {'data-test': 'employer-name'}) or
-                            card.find('div', class_='employerName')
-                        )
-                        company = self._clean(company_elem.text) if company_elem else ''
-                        
-                        # Location
-                        loc_elem = card.find('span', {'data-test': 'emp-location'}) or card.find('span', class_='loc')
-                        loc = self._clean(loc_elem.text) if loc_elem else location
-                        
-                        # Salary
-                        salary_elem = card.find('span', {'data-test': 'detailSalary'})
-                        salary = self._clean(salary_elem.text) if salary_elem else ''
-                        
-                        # URL
-                        job_url = ""
-                        if title_elem and title_elem.name == 'a':
-                            href = title_elem.get('href', '')
-                            job_url = f"https://www.glassdoor.co.in{href}" if href.startswith('/') else href
-                        
-                        jobs.append({
-                            'title': title,
-                            'company': company,
-                            'location': loc,
-                            'url': job_url,
-                            'source': 'Glassdoor',
-                            'salary_raw': salary,
-                        })
+                    # Title
+                    title_elem = (
+                        card.find('a', {'data-test': 'job-link'}) or
+                        card.find('a', class_='jobLink') or
+                        card.find('div', {'data-test': 'job-title'})
+                    )
+                    if not title_elem:
+                        continue
                         
-                    except Exception as e:
+                    title = self._clean(title_elem.text)
+                    if not title or not self._is_pm_job(title):
                         continue
+                    
+                    # Company
+                    company_elem = (
+                        card.find('div', {'data-test': 'employer-name'}) or
+                        card.find('div', class_='employerName')
+                    )
+                    company = self._clean(company_elem.text) if company_elem else ''
+                    
+                    # Location
+                    loc_elem = card.find('span', {'data-test': 'emp-location'}) or card.find('span', class_='loc')
+                    loc = self._clean(loc_elem.text) if loc_elem else location
+                    
+                    # Salary
+                    salary_elem = card.find('span', {'data-test': 'detailSalary'})
+                    salary = self._clean(salary_elem.text) if salary_elem else ''
+                    
+                    # URL
+                    job_url = ""
+                    if title_elem and title_elem.name == 'a':
+                        href = title_elem.get('href', '')
+                        job_url = f"https://www.glassdoor.co.in{href}" if href.startswith('/') else href
+                    
+                    jobs.append({
+                        'title': title,
+                        'company': company,
+                        'location': loc,
+                        'url': job_url,
+                        'source': 'Glassdoor',
+                        'salary_raw': salary,
+                    })
                 
                 self._smart_delay(2, 5)
                 
@@ -691,72 +1085,69 @@ class UltimateJobScraper:
         
         for page in range(1, pages + 1):
             try:
-                url = f"https://www.foundit.in/srp/results?query={quote(query)}&locations={quote(location)}&sort=1&limit=50&page={page}"
+                url = f"https://www.foundit.in/srp/results?query={_quote(query)}&locations={_quote(location)}&sort=1&limit=50&page={page}"
                 
                 # Foundit uses JSON API
-                self._rotate_user_agent()
-                self.session.headers.update({
-                    'Accept': 'application/json',
-                })
-                
-                response = self._make_request(url)
+                response = self._make_request(url, headers={'Accept': 'application/json'})
                 if not response:
                     continue
                 
                 # Try JSON first
                 try:
-                    data = response.json()
-                    job_list = data.get('jobDetails', []) or data.get('jobs', [])
+                    data = _json_loads(response.content)
+                except ValueError:
+                    data = None
+                
+                if isinstance(data, dict):
+                    job_list = data.get('jobDetails') or data.get('jobs') or []
                     
                     for job in job_list:
-                        title = job.get('title', '') or job.get('designation', '')
-                        if not title or not self._is_pm_job(title):
+                        if not isinstance(job, dict):
+                            continue
+                        title = job.get('title') or job.get('designation')
+                        # _is_pm_job is lru_cached: a list/dict title would raise and drop the page
+                        if not isinstance(title, str) or not title or not self._is_pm_job(title):
                             continue
                         
+                        locations = job.get('locations')
                         jobs.append({
                             'title': title,
                             'company': job.get('companyName', '') or job.get('company', ''),
-                            'location': job.get('locations', [''])[0] if isinstance(job.get('locations'), list) else job.get('location', location),
+                            'location': (locations[0] if locations else '') if isinstance(locations, list) else job.get('location', location),
                             'url': f"https://www.foundit.in/job/{job.get('jobId', '')}",
                             'source': 'Foundit',
                             'experience': job.get('experience', ''),
                             'salary_raw': job.get('salary', ''),
                         })
-                except:
+                else:
                     # Fallback to HTML parsing
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                    soup = self._parse_html(response, FOUNDIT_CARDS)
                     cards = soup.find_all('div', class_='card-apply-content')
                     
                     for card in cards:
-                        try:
-                            title_elem = card.find('h2') or card.find('a', class_='job-title')
-                            if not title_elem:
-                                continue
-                            title = self._clean(title_elem.text)
-                            if not self._is_pm_job(title):
-                                continue
-                            
-                            company_elem = card.find('span', class_='company-name')
-                            loc_elem = card.find('span', class_='location')
-                            
-                            jobs.append({
-                                'title': title,
-                                'company': self._clean(company_elem.text) if company_elem else '',
-                                'location': self._clean(loc_elem.text) if loc_elem else location,
-                                'url': '',
-                                'source': 'Foundit',
-                            })
-                        except:
+                        title_elem = card.find('h2') or card.find('a', class_='job-title')
+                        if not title_elem:
                             continue
+                        title = self._clean(title_elem.text)
+                        if not self._is_pm_job(title):
+                            continue
+                        
+                        company_elem = card.find('span', class_='company-name')
+                        loc_elem = card.find('span', class_='location')
+                        
+                        jobs.append({
+                            'title': title,
+                            'company': self._clean(company_elem.text) if company_elem else '',
+                            'location': self._clean(loc_elem.text) if loc_elem else location,
+                            'url': '',
+                            'source': 'Foundit',
+                        })
                 
                 self._smart_delay()
                 
             except Exception as e:
                 logger.error(f"[Foundit] Error on page {page}: {e}")
         
-        # Reset headers
-        self.session.headers.update({'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'})
-        
         logger.info(f"[Foundit] Found {len(jobs)} jobs")
         return jobs
 
@@ -779,40 +1170,36 @@ class UltimateJobScraper:
                 if not response:
                     continue
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
-                cards = soup.find_all('div', class_='individual_internship') or soup.find_all('div', {'class': re.compile(r'job-internship')})
+                soup = self._parse_html(response, INTERNSHALA_CARDS)
+                cards = soup.find_all('div', class_='individual_internship') or soup.find_all('div', {'class': _JOB_INTERNSHIP_CLASS})
                 
                 for card in cards:
-                    try:
-                        title_elem = card.find('h3', class_='job-internship-name') or card.find('a', class_='view_detail_button')
-                        if not title_elem:
-                            continue
-                            
-                        title = self._clean(title_elem.text)
-                        if not title or not self._is_pm_job(title):
-                            continue
-                        
-                        company_elem = card.find('p', class_='company-name') or card.find('h4', class_='company_name')
-                        loc_elem = card.find('div', id='location_names') or card.find('span', class_='location_link')
-                        stipend_elem = card.find('span', class_='stipend') or card.find('div', class_='stipend')
-                        
-                        link = card.find('a', class_='view_detail_button') or card.find('a', href=True)
-                        job_url = ""
-                        if link:
-                            href = link.get('href', '')
-                            job_url = f"https://internshala.com{href}" if href.startswith('/') else href
-                        
-                        jobs.append({
-                            'title': title,
-                            'company': self._clean(company_elem.text) if company_elem else '',
-                            'location': self._clean(loc_elem.text) if loc_elem else 'India',
-                            'url': job_url,
-                            'source': 'Internshala',
-                            'salary_raw': self._clean(stipend_elem.text) if stipend_elem else '',
-                        })
+                    title_elem = card.find('h3', class_='job-internship-name') or card.find('a', class_='view_detail_button')
+                    if not title_elem:
+                        continue
                         
-                    except Exception as e:
+                    title = self._clean(title_elem.text)
+                    if not title or not self._is_pm_job(title):
                         continue
+                    
+                    company_elem = card.find('p', class_='company-name') or card.find('h4', class_='company_name')
+                    loc_elem = card.find('div', id='location_names') or card.find('span', class_='location_link')
+                    stipend_elem = card.find('span', class_='stipend') or card.find('div', class_='stipend')
+                    
+                    link = card.find('a', class_='view_detail_button') or card.find('a', href=True)
+                    job_url = ""
+                    if link:
+                        href = link.get('href', '')
+                        job_url = f"https://internshala.com{href}" if href.startswith('/') else href
+                    
+                    jobs.append({
+                        'title': title,
+                        'company': self._clean(company_elem.text) if company_elem else '',
+                        'location': self._clean(loc_elem.text) if loc_elem else 'India',
+                        'url': job_url,
+                        'source': 'Internshala',
+                        'salary_raw': self._clean(stipend_elem.text) if stipend_elem else '',
+                    })
                 
                 self._smart_delay()
                 
@@ -843,39 +1230,45 @@ class UltimateJobScraper:
                 'page': 1,
             }
             
-            self._rotate_user_agent()
-            self.session.headers.update({
+            headers = {
                 'Accept': 'application/json',
                 'X-Requested-With': 'XMLHttpRequest',
-            })
+            }
             
             for page in range(1, pages + 1):
                 params['page'] = page
-                response = self.session.get(url, params=params, timeout=15)
+                response = self._make_request(url, retries=1, headers=headers, params=params)
                 
-                if response.status_code != 200:
+                if not response:
                     # Try HTML fallback
                     break
                 
                 try:
-                    data = response.json()
-                    job_list = data.get('jobs', []) or data.get('results', [])
+                    data = _json_loads(response.content)
+                except ValueError:
+                    data = None
+                
+                if isinstance(data, dict):
+                    job_list = data.get('jobs') or data.get('results') or []
                     
                     for job in job_list:
-                        title = job.get('title', '') or job.get('designation', '')
-                        if not title or not self._is_pm_job(title):
+                        if not isinstance(job, dict):
+                            continue
+                        title = job.get('title') or job.get('designation')
+                        # _is_pm_job is lru_cached: a list/dict title would raise and drop the page
+                        if not isinstance(title, str) or not title or not self._is_pm_job(title):
                             continue
                         
+                        company = job.get('company')
+                        locations = job.get('locations')
                         jobs.append({
                             'title': title,
-                            'company': job.get('company', {}).get('name', '') or job.get('company_name', ''),
-                            'location': job.get('locations', [''])[0] if isinstance(job.get('locations'), list) else location,
+                            'company': (company.get('name', '') if isinstance(company, dict) else '') or job.get('company_name', ''),
+                            'location': (locations[0] if locations else '') if isinstance(locations, list) else location,
                             'url': f"https://www.instahyre.com/job/{job.get('id', '')}",
                             'source': 'Instahyre',
                             'salary_raw': job.get('salary', ''),
                         })
-                except:
-                    pass
                 
                 self._smart_delay()
                 
@@ -885,38 +1278,33 @@ class UltimateJobScraper:
         # Fallback to HTML scraping
         if not jobs:
             try:
-                url = f"https://www.instahyre.com/search-jobs/?location={quote(location)}&search={quote(query)}"
+                url = f"https://www.instahyre.com/search-jobs/?location={_quote(location)}&search={_quote(query)}"
                 response = self._make_request(url)
                 if response:
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                    soup = self._parse_html(response, INSTAHYRE_CARDS)
                     cards = soup.find_all('div', class_='employer-row')
                     
                     for card in cards:
-                        try:
-                            title_elem = card.find('h4') or card.find('a', class_='job-title')
-                            if not title_elem:
-                                continue
-                            title = self._clean(title_elem.text)
-                            if not self._is_pm_job(title):
-                                continue
-                            
-                            company_elem = card.find('p', class_='employer-name')
-                            loc_elem = card.find('span', class_='location')
-                            
-                            jobs.append({
-                                'title': title,
-                                'company': self._clean(company_elem.text) if company_elem else '',
-                                'location': self._clean(loc_elem.text) if loc_elem else location,
-                                'url': '',
-                                'source': 'Instahyre',
-                            })
-                        except:
+                        title_elem = card.find('h4') or card.find('a', class_='job-title')
+                        if not title_elem:
                             continue
+                        title = self._clean(title_elem.text)
+                        if not self._is_pm_job(title):
+                            continue
+                        
+                        company_elem = card.find('p', class_='employer-name')
+                        loc_elem = card.find('span', class_='location')
+                        
+                        jobs.append({
+                            'title': title,
+                            'company': self._clean(company_elem.text) if company_elem else '',
+                            'location': self._clean(loc_elem.text) if loc_elem else location,
+                            'url': '',
+                            'source': 'Instahyre',
+                        })
             except:
                 pass
         
-        self.session.headers.update({'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'})
-        
         logger.info(f"[Instahyre] Found {len(jobs)} jobs")
         return jobs
 
@@ -939,45 +1327,41 @@ class UltimateJobScraper:
             if not response:
                 return jobs
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = self._parse_html(response, WELLFOUND_CARDS)
             
             # Look for job listings
             cards = (
-                soup.find_all('div', {'class': re.compile(r'styles_jobListing')}) or
-                soup.find_all('div', {'class': re.compile(r'job-listing')}) or
+                soup.find_all('div', {'class': _STYLES_JOB_LISTING_CLASS}) or
+                soup.find_all('div', {'class': _JOB_LISTING_CLASS}) or
                 soup.find_all('div', class_='job-link')
             )
             
             for card in cards:
-                try:
-                    title_elem = card.find('a', {'class': re.compile(r'title')}) or card.find('h4')
-                    if not title_elem:
-                        continue
-                        
-                    title = self._clean(title_elem.text)
-                    if not title or not self._is_pm_job(title):
-                        continue
-                    
-                    company_elem = card.find('a', {'class': re.compile(r'company')}) or card.find('h5')
-                    loc_elem = card.find('span', {'class': re.compile(r'location')})
-                    salary_elem = card.find('span', {'class': re.compile(r'salary')})
-                    
-                    job_url = ""
-                    if title_elem.name == 'a':
-                        href = title_elem.get('href', '')
-                        job_url = f"https://wellfound.com{href}" if href.startswith('/') else href
-                    
-                    jobs.append({
-                        'title': title,
-                        'company': self._clean(company_elem.text) if company_elem else '',
-                        'location': self._clean(loc_elem.text) if loc_elem else 'Remote',
-                        'url': job_url,
-                        'source': 'Wellfound',
-                        'salary_raw': self._clean(salary_elem.text) if salary_elem else '',
-                    })
+                title_elem = card.find('a', {'class': _TITLE_CLASS}) or card.find('h4')
+                if not title_elem:
+                    continue
                     
-                except Exception as e:
+                title = self._clean(title_elem.text)
+                if not title or not self._is_pm_job(title):
                     continue
+                
+                company_elem = card.find('a', {'class': _COMPANY_CLASS}) or card.find('h5')
+                loc_elem = card.find('span', {'class': _LOCATION_CLASS})
+                salary_elem = card.find('span', {'class': _SALARY_CLASS})
+                
+                job_url = ""
+                if title_elem.name == 'a':
+                    href = title_elem.get('href', '')
+                    job_url = f"https://wellfound.com{href}" if href.startswith('/') else href
+                
+                jobs.append({
+                    'title': title,
+                    'company': self._clean(company_elem.text) if company_elem else '',
+                    'location': self._clean(loc_elem.text) if loc_elem else 'Remote',
+                    'url': job_url,
+                    'source': 'Wellfound',
+                    'salary_raw': self._clean(salary_elem.text) if salary_elem else '',
+                })
             
             self._smart_delay()
             
@@ -1005,47 +1389,43 @@ class UltimateJobScraper:
             if not response:
                 return jobs
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = self._parse_html(response)
             
             cards = (
-                soup.find_all('div', {'class': re.compile(r'job-card')}) or
-                soup.find_all('div', {'class': re.compile(r'JobCard')}) or
+                soup.find_all('div', {'class': _JOB_CARD_CLASS}) or
+                soup.find_all('div', {'class': _JOBCARD_CLASS}) or
                 soup.find_all('article')
             )
             
             for card in cards:
-                try:
-                    title_elem = card.find('h3') or card.find('a', {'class': re.compile(r'title')})
-                    if not title_elem:
-                        continue
-                        
-                    title = self._clean(title_elem.text)
-                    if not title or not self._is_pm_job(title):
-                        continue
-                    
-                    company_elem = card.find('h4') or card.find('span', {'class': re.compile(r'company')})
-                    loc_elem = card.find('span', {'class': re.compile(r'location')})
-                    salary_elem = card.find('span', {'class': re.compile(r'salary')})
-                    exp_elem = card.find('span', {'class': re.compile(r'experience')})
-                    
-                    link = card.find('a', href=True)
-                    job_url = ""
-                    if link:
-                        href = link.get('href', '')
-                        job_url = f"https://cutshort.io{href}" if href.startswith('/') else href
-                    
-                    jobs.append({
-                        'title': title,
-                        'company': self._clean(company_elem.text) if company_elem else '',
-                        'location': self._clean(loc_elem.text) if loc_elem else location,
-                        'url': job_url,
-                        'source': 'Cutshort',
-                        'experience': self._clean(exp_elem.text) if exp_elem else '',
-                        'salary_raw': self._clean(salary_elem.text) if salary_elem else '',
-                    })
+                title_elem = card.find('h3') or card.find('a', {'class': _TITLE_CLASS})
+                if not title_elem:
+                    continue
                     
-                except Exception as e:
+                title = self._clean(title_elem.text)
+                if not title or not self._is_pm_job(title):
                     continue
+                
+                company_elem = card.find('h4') or card.find('span', {'class': _COMPANY_CLASS})
+                loc_elem = card.find('span', {'class': _LOCATION_CLASS})
+                salary_elem = card.find('span', {'class': _SALARY_CLASS})
+                exp_elem = card.find('span', {'class': _EXPERIENCE_CLASS})
+                
+                link = card.find('a', href=True)
+                job_url = ""
+                if link:
+                    href = link.get('href', '')
+                    job_url = f"https://cutshort.io{href}" if href.startswith('/') else href
+                
+                jobs.append({
+                    'title': title,
+                    'company': self._clean(company_elem.text) if company_elem else '',
+                    'location': self._clean(loc_elem.text) if loc_elem else location,
+                    'url': job_url,
+                    'source': 'Cutshort',
+                    'experience': self._clean(exp_elem.text) if exp_elem else '',
+                    'salary_raw': self._clean(salary_elem.text) if salary_elem else '',
+                })
             
             self._smart_delay()
             
@@ -1068,52 +1448,48 @@ class UltimateJobScraper:
         
         for page in range(1, pages + 1):
             try:
-                url = f"https://www.timesjobs.com/candidate/job-search.html?searchType=personal498&from=submit&searchTextSrc=as&searchTextText={quote(query)}&txtLocation={quote(location)}&sequence={page}&startPage={page}"
+                url = f"https://www.timesjobs.com/candidate/job-search.html?searchType=personal498&from=submit&searchTextSrc=as&searchTextText={_quote(query)}&txtLocation={_quote(location)}&sequence={page}&startPage={page}"
                 
                 response = self._make_request(url)
                 if not response:
                     continue
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = self._parse_html(response, TIMESJOBS_CARDS)
                 
                 cards = soup.find_all('li', class_='clearfix job-bx')
                 
                 for card in cards:
-                    try:
-                        title_elem = card.find('h2')
-                        if not title_elem:
-                            continue
-                            
-                        title = self._clean(title_elem.text)
-                        if not title or not self._is_pm_job(title):
-                            continue
-                        
-                        company_elem = card.find('h3', class_='joblist-comp-name')
-                        loc_elem = card.find('span', title='Location')
-                        exp_elem = card.find('span', title='Experience')
-                        
-                        link = card.find('a', href=True)
-                        job_url = ""
-                        if link:
-                            href = link.get('href', '')
-                            job_url = href
-                        
-                        # Posted date
-                        date_elem = card.find('span', class_='sim-posted')
-                        posted_raw = self._clean(date_elem.text) if date_elem else ''
-                        
-                        jobs.append({
-                            'title': title,
-                            'company': self._clean(company_elem.text) if company_elem else '',
-                            'location': self._clean(loc_elem.text) if loc_elem else location,
-                            'url': job_url,
-                            'source': 'TimesJobs',
-                            'experience': self._clean(exp_elem.text) if exp_elem else '',
-                            'posted_date_raw': posted_raw,
-                        })
+                    title_elem = card.find('h2')
+                    if not title_elem:
+                        continue
                         
-                    except Exception as e:
+                    title = self._clean(title_elem.text)
+                    if not title or not self._is_pm_job(title):
                         continue
+                    
+                    company_elem = card.find('h3', class_='joblist-comp-name')
+                    loc_elem = card.find('span', title='Location')
+                    exp_elem = card.find('span', title='Experience')
+                    
+                    link = card.find('a', href=True)
+                    job_url = ""
+                    if link:
+                        href = link.get('href', '')
+                        job_url = href
+                    
+                    # Posted date
+                    date_elem = card.find('span', class_='sim-posted')
+                    posted_raw = self._clean(date_elem.text) if date_elem else ''
+                    
+                    jobs.append({
+                        'title': title,
+                        'company': self._clean(company_elem.text) if company_elem else '',
+                        'location': self._clean(loc_elem.text) if loc_elem else location,
+                        'url': job_url,
+                        'source': 'TimesJobs',
+                        'experience': self._clean(exp_elem.text) if exp_elem else '',
+                        'posted_date_raw': posted_raw,
+                    })
                 
                 self._smart_delay()
                 
@@ -1142,43 +1518,39 @@ class UltimateJobScraper:
                 if not response:
                     continue
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = self._parse_html(response, SHINE_CARDS)
                 
                 cards = soup.find_all('div', class_='job_card_content')
                 
                 for card in cards:
-                    try:
-                        title_elem = card.find('h3') or card.find('a', class_='job_title')
-                        if not title_elem:
-                            continue
-                            
-                        title = self._clean(title_elem.text)
-                        if not title or not self._is_pm_job(title):
-                            continue
-                        
-                        company_elem = card.find('span', class_='comp_name')
-                        loc_elem = card.find('span', class_='loc')
-                        exp_elem = card.find('span', class_='exp')
-                        salary_elem = card.find('span', class_='sal')
-                        
-                        link = title_elem if title_elem.name == 'a' else card.find('a', href=True)
-                        job_url = ""
-                        if link:
-                            href = link.get('href', '')
-                            job_url = f"https://www.shine.com{href}" if href.startswith('/') else href
-                        
-                        jobs.append({
-                            'title': title,
-                            'company': self._clean(company_elem.text) if company_elem else '',
-                            'location': self._clean(loc_elem.text) if loc_elem else location,
-                            'url': job_url,
-                            'source': 'Shine',
-                            'experience': self._clean(exp_elem.text) if exp_elem else '',
-                            'salary_raw': self._clean(salary_elem.text) if salary_elem else '',
-                        })
+                    title_elem = card.find('h3') or card.find('a', class_='job_title')
+                    if not title_elem:
+                        continue
                         
-                    except Exception as e:
+                    title = self._clean(title_elem.text)
+                    if not title or not self._is_pm_job(title):
                         continue
+                    
+                    company_elem = card.find('span', class_='comp_name')
+                    loc_elem = card.find('span', class_='loc')
+                    exp_elem = card.find('span', class_='exp')
+                    salary_elem = card.find('span', class_='sal')
+                    
+                    link = title_elem if title_elem.name == 'a' else card.find('a', href=True)
+                    job_url = ""
+                    if link:
+                        href = link.get('href', '')
+                        job_url = f"https://www.shine.com{href}" if href.startswith('/') else href
+                    
+                    jobs.append({
+                        'title': title,
+                        'company': self._clean(company_elem.text) if company_elem else '',
+                        'location': self._clean(loc_elem.text) if loc_elem else location,
+                        'url': job_url,
+                        'source': 'Shine',
+                        'experience': self._clean(exp_elem.text) if exp_elem else '',
+                        'salary_raw': self._clean(salary_elem.text) if salary_elem else '',
+                    })
                 
                 self._smart_delay()
                 
@@ -1202,7 +1574,8 @@ class UltimateJobScraper:
             sources: Which sources to use (None = all)
         
         Returns:
-            List of raw job dictionaries
+            List of job dictionaries, already processed per (source, query, location);
+            process_jobs still dedupes them across units
         """
         available_sources = {
             'linkedin': self.scrape_linkedin,
@@ -1222,71 +1595,153 @@ class UltimateJobScraper:
             # Default to most reliable sources
             sources = ['linkedin', 'naukri', 'indeed', 'foundit', 'timesjobs', 'internshala']
         
-        all_jobs = []
+        source_names = []
+        for source_name in dict.fromkeys(sources):
+            if source_name not in available_sources:
+                logger.warning(f"Unknown source: {source_name}")
+                continue
+            source_names.append(source_name)
         
-        for location in locations:
-            for source_name in sources:
-                if source_name not in available_sources:
-                    logger.warning(f"Unknown source: {source_name}")
-                    continue
-                
-                scraper_func = available_sources[source_name]
-                
+        if not source_names:
+            return []
+        
+        # Expired entries are only skipped on read; clear them out so the cache stays bounded
+        self._prune_cache()
+        
+        # Units are independent, so a bounded pool works through them in any order;
+        # per-host slots in _make_request keep any one board from being flooded
+        units = self._plan_units(source_names, locations, pages)
+        results = [(0, []) for _ in units]
+        if SCRAPE_PROCESSES > 1:
+            # spawn, not fork: the API process has live threads, locks and sockets
+            executor = ProcessPoolExecutor(
+                max_workers=min(SCRAPE_PROCESSES, len(units)),
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker_scraper,
+                initargs=(self.cache_dir, self.refresh_cache),
+            )
+            run_unit = _scrape_unit_in_worker
+        else:
+            executor = ThreadPoolExecutor(max_workers=min(MAX_SCRAPE_WORKERS, len(units)))
+            run_unit = self._scrape_named_unit
+        
+        with executor as pool:
+            futures = {pool.submit(run_unit, *units[i], pages): i for i in self._interleave_units(units)}
+            for future in as_completed(futures):
+                i = futures[future]
                 try:
-                    for query in self.SEARCH_QUERIES[:5]:  # Limit queries to avoid too many requests
-                        jobs = scraper_func(query, location, pages)
-                        all_jobs.extend(jobs)
-                        
+                    results[i] = future.result()
                 except Exception as e:
-                    logger.error(f"Error scraping {source_name}: {e}")
+                    logger.error(f"Error scraping {units[i][0]}: {e}")
         
-        return all_jobs
+        self.last_raw_count = sum(raw_count for raw_count, _ in results)
+        # Units were planned in the old sequential order, so process_jobs keeps the same duplicate
+        return [job for _, jobs in results for job in jobs]
+    
+    def _plan_units(self, source_names: List[str], locations: List[str], pages: int) -> List[tuple]:
+        """(source, query, location, cache_key) work units in location/source/query order"""
+        units = []
+        seen_units = set()
+        day = datetime.now().strftime("%Y-%m-%d")
+        for location in locations:
+            for source_name in source_names:
+                key_args = self.SOURCE_KEY_ARGS.get(source_name, ('query', 'location'))
+                for query in self.SEARCH_QUERIES[:5]:  # Limit queries to avoid too many requests
+                    unit = (source_name,) + tuple({'query': query, 'location': location}[arg] for arg in key_args)
+                    if unit in seen_units:
+                        continue
+                    seen_units.add(unit)
+                    cache_key = '|'.join((*unit, str(pages), day))
+                    units.append((source_name, query, location, cache_key))
+        return units
+    
+    @staticmethod
+    def _interleave_units(units: List[tuple]) -> List[int]:
+        """Unit indexes round-robin across sources, so the pool spreads over boards
+        instead of filling every worker with one board's units (which just queue on its turns)"""
+        by_source = {}
+        for i, unit in enumerate(units):
+            by_source.setdefault(unit[0], []).append(i)
+        return [i for batch in itertools.zip_longest(*by_source.values()) for i in batch if i is not None]
+    
+    def _scrape_named_unit(self, source_name: str, query: str, location: str, cache_key: str, pages: int) -> tuple:
+        """_scrape_unit for a planned unit tuple, resolving the source by name"""
+        return self._scrape_unit(getattr(self, f"scrape_{source_name}"), query, location, pages, cache_key)
+    
+    def _scrape_unit(self, scraper_func, query: str, location: str, pages: int, cache_key: str) -> tuple:
+        """Scrape + process one work unit, reusing today's processed result if cached
+        
+        Returns:
+            (raw job count, processed jobs)
+        """
+        path = self._processed_cache_path(cache_key) if self.cache_dir else None
+        if path and not self.refresh_cache:
+            try:
+                with gzip.open(path, 'rb') as f:
+                    cached = _json_loads(f.read())
+                return cached['raw_count'], cached['jobs']
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+        
+        # A thread runs one unit at a time, so the per-thread count covers just this unit
+        self._local.failed_requests = 0
+        raw_jobs = scraper_func(query, location, pages)
+        jobs = self.process_jobs(raw_jobs)
+        
+        # The result is reused all day: only keep complete, non-empty ones, so a blip,
+        # 403 or 429 doesn't blank this unit until tomorrow
+        if self._local.failed_requests:
+            logger.warning(f"Not caching {cache_key}: {self._local.failed_requests} page fetch(es) failed")
+        elif path and jobs:
+            self._write_cache_file(path, _json_dumps({'raw_count': len(raw_jobs), 'jobs': jobs}))
+        return len(raw_jobs), jobs
     
     def process_jobs(self, raw_jobs: List[Dict]) -> List[Dict]:
         """
         Process raw jobs into standardized format
         """
         processed = []
-        seen_ids = set()
+        seen_keys = set()
+        # One timestamp per batch instead of a datetime.now() per row
+        created_at = datetime.now().isoformat()
+        posted_dates = {}
         
         for job in raw_jobs:
             try:
                 title = job.get('title', '')
                 company = job.get('company', '')
-                location = job.get('location', '')
+                location = job.get('location') or ''
                 
                 if not title or not company:
                     continue
+                # JSON sources can hand back dicts/lists here; sqlite would reject the whole batch
+                if not isinstance(title, str) or not isinstance(company, str) or not isinstance(location, str):
+                    continue
                 
-                job_id = self._generate_job_id(title, company, location)
+                # Dedup on the raw key first so duplicates never pay for the MD5
+                dedup_key = f"{title}|{company}|{location}".lower()
+                if dedup_key in seen_keys:
+                    continue
+                seen_keys.add(dedup_key)
                 
-                if job_id in seen_ids:
+                # Rows from scrape_all (or the processed cache) are already standardized
+                if 'id' in job:
+                    processed.append(job)
                     continue
-                seen_ids.add(job_id)
+                
+                job_id = self._generate_job_id(title, company, location)
                 
                 # Parse experience
-                exp_text = job.get('experience', '')
-                exp_display = ""
-                exp_min = 0
-                exp_max = 0
-                if exp_text:
-                    match = re.search(r'(\d+)\s*[-–to]\s*(\d+)', exp_text.lower().replace(' ', ''))
-                    if match:
-                        exp_min = int(match.group(1))
-                        exp_max = int(match.group(2))
-                        exp_display = f"{exp_min}-{exp_max} yrs"
-                    else:
-                        match = re.search(r'(\d+)', exp_text)
-                        if match:
-                            exp_min = int(match.group(1))
-                            exp_max = exp_min + 3
-                            exp_display = f"{exp_min}+ yrs"
+                exp_min, exp_max, exp_display = self._parse_experience(job.get('experience', ''))
                 
                 # Parse salary
                 sal_min, sal_max, sal_display = self._parse_salary(job.get('salary_raw', ''))
                 
-                # Parse date
-                posted_date = self._parse_date(job.get('posted_date_raw', ''))
+                # Parse date (relative to today, so memoized per batch only)
+                posted_raw = job.get('posted_date_raw', '')
+                posted_date = posted_dates.get(posted_raw)
+                if posted_date is None:
+                    posted_date = posted_dates[posted_raw] = self._parse_date(posted_raw)
                 
                 # Detect work type from location/title
                 work_type = self._detect_work_type(f"{title} {location}")
@@ -1320,7 +1775,7 @@ class UltimateJobScraper:
                     'is_bookmarked': False,
                     'applied_date': None,
                     'notes': '',
-                    'created_at': datetime.now().isoformat(),
+                    'created_at': created_at,
                 })
                 
             except Exception as e:
@@ -1331,11 +1786,29 @@ class UltimateJobScraper:
         return processed
 
 
+# ============================================================================
+# PROCESS POOL WORKERS - one scraper per spawned process (SCRAPER_PROCESSES)
+# ============================================================================
+
+_worker_scraper = None
+
+
+def _init_worker_scraper(cache_dir: Optional[str], refresh_cache: bool):
+    """Build the process's scraper once so its session is reused across units"""
+    global _worker_scraper
+    _worker_scraper = UltimateJobScraper(cache_dir=cache_dir, refresh_cache=refresh_cache)
+
+
+def _scrape_unit_in_worker(source_name: str, query: str, location: str, cache_key: str, pages: int) -> tuple:
+    return _worker_scraper._scrape_named_unit(source_name, query, location, cache_key, pages)
+
+
 # ============================================================================
 # CONVENIENCE FUNCTION
 # ============================================================================
 
-def scrape_pm_jobs(locations: List[str] = None, pages: int = 3, sources: List[str] = None) -> List[Dict]:
+def scrape_pm_jobs(locations: List[str] = None, pages: int = 3, sources: List[str] = None,
+                   refresh_cache: bool = False) -> List[Dict]:
     """
     Convenience function to scrape PM jobs
     
@@ -1343,6 +1816,7 @@ def scrape_pm_jobs(locations: List[str] = None, pages: int = 3, sources: List[st
         locations: List of locations (default: India)
         pages: Pages per source (default: 3)
         sources: Which sources to use (default: all main ones)
+        refresh_cache: Re-fetch pages even if a fresh cached copy exists
     
     Returns:
         List of processed job dictionaries
@@ -1350,7 +1824,7 @@ def scrape_pm_jobs(locations: List[str] = None, pages: int = 3, sources: List[st
     if locations is None:
         locations = ['India', 'Bangalore', 'Mumbai', 'Delhi', 'Hyderabad']
     
-    scraper = UltimateJobScraper()
+    scraper = UltimateJobScraper(refresh_cache=refresh_cache)
     raw_jobs = scraper.scrape_all(locations, pages, sources)
     processed_jobs = scraper.process_jobs(raw_jobs)
     
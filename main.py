@@ -2,63 +2,250 @@
 PM Job Hub - Production Server
 Serves both the FastAPI backend and static frontend
 """
+import gzip
+import hashlib
 import os
+import re
+from email.utils import formatdate, parsedate_to_datetime
 from fastapi import FastAPI, Request
+from fastapi.routing import APIRoute
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, HTMLResponse
-from fastapi.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, Response
 from pathlib import Path
 
 # Import the backend app directly - it already has /api routes
-from backend.app import app as api_app, init_db
+from backend.app import app as api_app, lifespan
 
 # Get the directory where this file is located
 BASE_DIR = Path(__file__).resolve().parent
 
-# Create main app
-app = FastAPI(title="PM Job Hub")
+# Create main app; the backend's lifespan initializes the database on startup
+app = FastAPI(title="PM Job Hub", lifespan=lifespan)
 
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
 
-# Initialize database on startup
-@app.on_event("startup")
-async def startup():
-    init_db()
+class EdgeMiddleware:
+    """Single pure-ASGI layer for per-request edge work: CORS and exact-path shortcuts"""
+    
+    # No cookies/auth headers are used, so no credentials and a bare "*" origin is valid
+    HEADERS = [
+        (b"access-control-allow-origin", b"*"),
+    ]
+    PREFLIGHT_HEADERS = HEADERS + [
+        (b"access-control-allow-methods", b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"),
+        (b"access-control-allow-headers", b"*"),
+        # Let browsers reuse a preflight for a day (they clamp to their own maximum)
+        (b"access-control-max-age", b"86400"),
+    ]
+    
+    def __init__(self, app, routes: dict):
+        self.app = app
+        # (method, path) -> async endpoint(request) returning a Response. These are answered
+        # here with one dict lookup instead of a scan of the route list plus FastAPI's
+        # dependency machinery, so only self-contained, parameter-free endpoints belong here
+        self.routes = routes
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        if scope["method"] == "OPTIONS" and any(
+            name == b"access-control-request-method" for name, _ in scope["headers"]
+        ):
+            await send({"type": "http.response.start", "status": 204, "headers": self.PREFLIGHT_HEADERS})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *self.HEADERS]
+            await send(message)
+        
+        endpoint = self.routes.get((scope["method"], scope["path"]))
+        if endpoint is not None:
+            response = await endpoint(Request(scope, receive))
+            await response(scope, receive, send_with_cors)
+            return
+        
+        await self.app(scope, receive, send_with_cors)
 
-# Include all routes from the backend API EXCEPT the root "/" route
+
+# Filled in below once the endpoints exist; the middleware stack is built on first request
+EDGE_ROUTES = {}
+
+# Compress job listings and the page shell; tiny JSON replies aren't worth the CPU
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+# CORS middleware. Added last so it is the outermost layer: preflights are answered
+# before gzip, exception handling or routing run at all. New edge concerns (headers,
+# timing) belong in EdgeMiddleware's one send wrapper rather than in another layer
+app.add_middleware(EdgeMiddleware, routes=EDGE_ROUTES)
+
+# Include the backend's API routes EXCEPT the root "/" route (we want our frontend there).
+# Its /docs, /redoc and /openapi.json routes are skipped too: this app already has its own,
+# and the copies could never match but were still scanned on every request.
+# Appending shares the route objects, so there is still a single router pass per request
 for route in api_app.routes:
-    # Skip the backend's root route - we want our frontend there
-    if hasattr(route, 'path') and route.path == "/":
-        continue
-    app.routes.append(route)
+    if isinstance(route, APIRoute) and route.path != "/":
+        app.routes.append(route)
 
 # Serve frontend at root
-@app.get("/", response_class=HTMLResponse)
-async def serve_frontend():
-    frontend_path = BASE_DIR / "frontend" / "index.html"
-    if frontend_path.exists():
-        return FileResponse(frontend_path)
-    # Fallback: return inline HTML with error message
-    return HTMLResponse(content=f"""
-    <!DOCTYPE html>
-    <html>
-    <head><title>PM Job Hub</title></head>
-    <body style="font-family: sans-serif; padding: 40px; text-align: center;">
-        <h1>🚀 PM Job Hub</h1>
-        <p>Frontend file not found at: {frontend_path}</p>
-        <p>But the API is working! Try: <a href="/api/sources">/api/sources</a></p>
-    </body>
-    </html>
-    """, status_code=200)
+FRONTEND_DIR = BASE_DIR / "frontend"
+INDEX_FILE = FRONTEND_DIR / "index.html"
+# Fresh for a minute, then browsers may show the cached copy while revalidating in the background
+CACHE_CONTROL = "public, max-age=60, stale-while-revalidate=300"
+# Content-hashed names (app.3f9a1c2b.js) never change content, so they can be cached for good
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+FINGERPRINTED_RE = re.compile(r"\.[0-9a-f]{8,}\.\w+$")
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that lets browsers reuse assets (for good when fingerprinted)"""
+    
+    def file_response(self, full_path, *args, **kwargs):
+        response = super().file_response(full_path, *args, **kwargs)
+        if FINGERPRINTED_RE.search(os.path.basename(full_path)):
+            response.headers.setdefault("Cache-Control", IMMUTABLE_CACHE_CONTROL)
+        else:
+            response.headers.setdefault("Cache-Control", CACHE_CONTROL)
+        return response
+
+
+# Set PM_SERVE_STATIC=0 when a reverse proxy serves frontend/ itself (see README):
+# the app then only answers /api/* and the docs
+SERVE_STATIC = os.environ.get("PM_SERVE_STATIC", "1") != "0"
+
+# The page shell is small and hit on every visit: read it once and serve it from
+# memory instead of stat + open + content-type guessing per request. Opening it
+# directly (no exists() check first) means the bytes and mtime come from one file
+INDEX_BYTES = None
+if SERVE_STATIC:
+    try:
+        with open(INDEX_FILE, "rb") as f:
+            INDEX_BYTES = f.read()
+            INDEX_MTIME = int(os.fstat(f.fileno()).st_mtime)
+    except OSError:
+        pass
+
+if INDEX_BYTES is not None:
+    INDEX_DIGEST = hashlib.sha1(INDEX_BYTES).hexdigest()
+    INDEX_ETAG = f'"{INDEX_DIGEST}"'
+    # The gzip body is a different representation, so it gets its own strong validator
+    INDEX_GZIP_ETAG = f'"{INDEX_DIGEST}-gzip"'
+    INDEX_HEADERS = {
+        "ETag": INDEX_ETAG,
+        "Last-Modified": formatdate(INDEX_MTIME, usegmt=True),
+        "Cache-Control": CACHE_CONTROL,
+        "Vary": "Accept-Encoding",
+    }
+    # Compressed once here at max level instead of by GZipMiddleware on every hit
+    INDEX_GZIP = gzip.compress(INDEX_BYTES, compresslevel=9, mtime=0)
+    INDEX_GZIP_HEADERS = {**INDEX_HEADERS, "ETag": INDEX_GZIP_ETAG, "Content-Encoding": "gzip"}
+    # A 304 repeats the negotiated variant's validators, without a body encoding
+    NOT_MODIFIED_HEADERS = {
+        INDEX_ETAG: INDEX_HEADERS,
+        INDEX_GZIP_ETAG: {**INDEX_HEADERS, "ETag": INDEX_GZIP_ETAG},
+    }
+    
+    def accepts_gzip(accept_encoding: str) -> bool:
+        """Whether Accept-Encoding allows gzip at least as much as identity (q=0 refuses it)"""
+        qualities = {}
+        for token in accept_encoding.split(","):
+            coding, *params = token.split(";")
+            quality = 1.0
+            for param in params:
+                name, _, value = param.strip().partition("=")
+                if name.lower() == "q":
+                    try:
+                        quality = float(value)
+                    except ValueError:
+                        quality = 0.0
+            qualities[coding.strip().lower()] = quality
+        gzip_quality = qualities.get("gzip", qualities.get("x-gzip", qualities.get("*", 0.0)))
+        return gzip_quality > 0 and gzip_quality >= qualities.get("identity", 0.0)
+    
+    def index_not_modified(request: Request, etag: str) -> bool:
+        """Whether the client's cached copy is the negotiated variant (etag) and still current"""
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            # If-None-Match wins over If-Modified-Since when both are sent
+            tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+            # Only the selected representation's tag may match (RFC 9110 13.1.2)
+            return "*" in tags or etag in tags
+        
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since:
+            try:
+                return parsedate_to_datetime(if_modified_since).timestamp() >= INDEX_MTIME
+            except (TypeError, ValueError):
+                pass
+        return False
+    
+    @app.api_route("/", methods=["GET", "HEAD"], include_in_schema=False)
+    async def serve_index(request: Request):
+        use_gzip = accepts_gzip(request.headers.get("accept-encoding", ""))
+        etag = INDEX_GZIP_ETAG if use_gzip else INDEX_ETAG
+        if index_not_modified(request, etag):
+            # Revisits only revalidate: no body, just the validators
+            return Response(status_code=304, headers=NOT_MODIFIED_HEADERS[etag])
+        if use_gzip:
+            return Response(content=INDEX_GZIP, media_type="text/html", headers=INDEX_GZIP_HEADERS)
+        return Response(content=INDEX_BYTES, media_type="text/html", headers=INDEX_HEADERS)
+    
+    # The busiest page skips routing (and GZipMiddleware, as it is already compressed)
+    EDGE_ROUTES[("GET", "/")] = EDGE_ROUTES[("HEAD", "/")] = serve_index
+elif SERVE_STATIC:
+    # Fallback: inline HTML with error message. Nothing in it varies per request,
+    # so the response (body encoded, headers rendered) is built once and reused
+    FRONTEND_MISSING = HTMLResponse(content=f"""
+        <!DOCTYPE html>
+        <html>
+        <head><title>PM Job Hub</title></head>
+        <body style="font-family: sans-serif; padding: 40px; text-align: center;">
+            <h1>🚀 PM Job Hub</h1>
+            <p>Frontend file not found at: {INDEX_FILE}</p>
+            <p>But the API is working! Try: <a href="/api/sources">/api/sources</a></p>
+        </body>
+        </html>
+        """, status_code=200)
+    
+    @app.get("/", response_class=HTMLResponse)
+    async def serve_frontend():
+        return FRONTEND_MISSING
+
+if SERVE_STATIC and FRONTEND_DIR.is_dir():
+    # Everything besides the index (bundles, images) is streamed from disk by StaticFiles,
+    # which also answers If-None-Match / If-Modified-Since with 304
+    app.mount("/static", CachedStaticFiles(directory=FRONTEND_DIR), name="static")
 
 if __name__ == "__main__":
     import uvicorn
     port = int(os.environ.get("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # Behind a reverse proxy on the same host (nginx: proxy_pass http://unix:/path.sock),
+    # set UDS to a socket path to skip loopback TCP; otherwise listen on PORT as before
+    uds = os.environ.get("UDS")
+    bind = {"uds": uds} if uds else {"host": "0.0.0.0", "port": port}
+    # Worker processes each run their own event loop (and lifespan; init_db is idempotent).
+    # Scrape progress in scraper_status is per process, so /api/scrape/status only reflects
+    # a running scrape when it hits the same worker: keep the default of 1 unless that's fine
+    workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+    # loop/http "auto" already pick uvloop and httptools when installed (see requirements)
+    # and fall back to asyncio/h11 elsewhere, e.g. uvloop is unavailable on Windows
+    # Multiple workers need an import string so each process can load the app itself.
+    # No access log: a formatted stdout line per request costs more than serving "/" itself
+    uvicorn.run(
+        "main:app" if workers > 1 else app,
+        **bind,
+        workers=workers,
+        access_log=False,
+        log_level="warning",
+        # Past 1000 open connections/tasks new requests get a quick 503 instead of queueing
+        # without bound; idle keep-alive sockets are dropped after 5s
+        limit_concurrency=1000,
+        timeout_keep_alive=5,
+        backlog=2048,
+        # Recycle workers now and then to cap slow memory growth. Only with several workers:
+        # the supervisor restarts them, whereas a single process would just exit
+        limit_max_requests=10000 if workers > 1 else None,
+    )